@@ -1,7 +1,10 @@
+import asyncio
 import logging
+import os
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright, Browser, Page
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Optional, TypedDict
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 from src.config.settings import (
     BROWSER_ARGS,
     VIEWPORT_WIDTH,
@@ -13,32 +16,265 @@ from src.config.settings import (
 
 logger = logging.getLogger(__name__)
 
-class BaseTransferPortalAgent(ABC):
-    def __init__(self):
-        self.scraping_timeout = SCRAPING_TIMEOUT
-        self.selector_timeout = WAIT_FOR_SELECTOR_TIMEOUT
+# Pool sizing knobs (env-configurable so deployments can match host capacity)
+BROWSER_POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", "2"))
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("BROWSER_POOL_RECYCLE_AFTER", "100"))
 
-    async def _setup_browser(self) -> tuple[Browser, Page]:
-        """Set up browser and page with common configuration."""
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=BROWSER_ARGS
-        )
-        
-        context = await browser.new_context(
+# Process-lifetime Playwright driver. Starting Playwright spawns the Node
+# driver process, so it is done exactly once and shared by everything.
+_playwright: Optional[Playwright] = None
+_playwright_lock = asyncio.Lock()
+
+
+async def get_playwright() -> Playwright:
+    """Return the shared Playwright instance, starting it on first use"""
+    global _playwright
+    if _playwright is None:
+        async with _playwright_lock:
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+    return _playwright
+
+
+async def shutdown_playwright():
+    """Stop the shared Playwright driver (call on process shutdown)"""
+    global _playwright
+    async with _playwright_lock:
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
+class BrowserPool:
+    """
+    Pool of pre-launched browser contexts shared by all scraper agents.
+
+    Launching Chromium per scrape costs hundreds of milliseconds and risks
+    thread exhaustion under concurrent load, so Playwright is started once
+    and contexts are checked out per scrape and returned afterwards.
+    Contexts are recycled after a bounded number of uses to keep native
+    memory from drifting.
+    """
+
+    _instance: Optional["BrowserPool"] = None
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE,
+                 recycle_after: int = BROWSER_POOL_RECYCLE_AFTER):
+        self.size = size
+        self.recycle_after = recycle_after
+        self._browser: Optional[Browser] = None
+        self._contexts: asyncio.Queue = asyncio.Queue()
+        self._use_counts: Dict[BrowserContext, int] = {}
+        self._recycle_count = 0
+        self._start_lock = asyncio.Lock()
+        self._started = False
+
+    @classmethod
+    def get(cls) -> "BrowserPool":
+        """Get the shared pool instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    async def start(self):
+        """Start Playwright once and pre-launch the pooled contexts"""
+        async with self._start_lock:
+            if self._started:
+                return
+            logger.info(f"Starting browser pool with {self.size} contexts")
+            playwright = await get_playwright()
+            self._browser = await playwright.chromium.launch(
+                headless=True,
+                args=list(dict.fromkeys([*BROWSER_ARGS, *DEFAULT_PERF_ARGS])),
+                chromium_sandbox=False,
+                handle_sigint=False,
+                handle_sigterm=False,
+                handle_sighup=False
+            )
+            for _ in range(self.size):
+                self._contexts.put_nowait(await self._new_context())
+            self._started = True
+
+    async def _new_context(self) -> BrowserContext:
+        context = await self._browser.new_context(
             viewport={'width': VIEWPORT_WIDTH, 'height': VIEWPORT_HEIGHT},
             user_agent=USER_AGENT,
             ignore_https_errors=True
         )
-        
+        self._use_counts[context] = 0
+        return context
+
+    async def acquire(self) -> BrowserContext:
+        """Check a context out of the pool, starting the pool if needed"""
+        if not self._started:
+            await self.start()
+        context = await self._contexts.get()
+        self._use_counts[context] = self._use_counts.get(context, 0) + 1
+        return context
+
+    async def release(self, context: BrowserContext):
+        """Return a context to the pool, recycling it once it has aged out"""
+        if self._use_counts.get(context, 0) >= self.recycle_after:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing recycled browser context: {str(e)}")
+            self._use_counts.pop(context, None)
+            context = await self._new_context()
+            self._recycle_count += 1
+            logger.info(f"Recycled browser context (total recycles: {self._recycle_count})")
+        self._contexts.put_nowait(context)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool metrics for monitoring endpoints"""
+        return {
+            "size": self.size,
+            "available": self._contexts.qsize(),
+            "recycle_after": self.recycle_after,
+            "recycle_count": self._recycle_count,
+            "started": self._started
+        }
+
+    async def stop(self):
+        """Tear down the pooled contexts, browser and Playwright driver"""
+        async with self._start_lock:
+            if not self._started:
+                return
+            while not self._contexts.empty():
+                context = self._contexts.get_nowait()
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"Error closing browser context: {str(e)}")
+            self._use_counts.clear()
+            if self._browser:
+                await self._browser.close()
+                self._browser = None
+            self._started = False
+
+
+class PlayerRecord(TypedDict, total=False):
+    """
+    Shape of a scraped player row.
+
+    Rows stay plain dicts (the orchestrators and serializers consume them by
+    key), but sharing one TypedDict keeps every row's key strings interned
+    and identical across sources instead of each scraper allocating its own.
+    """
+    source: str
+    rank: int
+    name: str
+    position: str
+    rating: float
+    nil_value: float
+    status: str
+    last_team: str
+    new_team: Optional[str]
+    profile_url: Optional[str]
+    # Lowercase projections added at index-build time
+    position_lc: str
+    previous_school_lc: str
+    destination_school_lc: str
+
+
+# Single-pass translation table for numeric parsing: strips currency symbols,
+# separators and whitespace in one C-level walk instead of staged replaces
+_STRIP_TABLE = str.maketrans("", "", "$, \t\n\r")
+
+# Resource types that text scraping never needs; aborting them cuts most of
+# the subresource bytes, parse CPU and page wait time
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Chromium flags that turn off features scraping never uses; they cut launch
+# time and steady-state CPU/memory regardless of what BROWSER_ARGS configures
+DEFAULT_PERF_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-features=TranslateUI,BackForwardCache,Translate",
+]
+
+
+class BaseTransferPortalAgent(ABC):
+    # Subclasses can opt out if a source needs styles/images to render data
+    BLOCK_RESOURCES = True
+
+    def __init__(self):
+        self.scraping_timeout = SCRAPING_TIMEOUT
+        self.selector_timeout = WAIT_FOR_SELECTOR_TIMEOUT
+        # Screenshots force a full compositor render and PNG encode per
+        # scrape; opt in with SCRAPER_DEBUG=1 when diagnosing selectors
+        self.debug_screenshots = os.environ.get("SCRAPER_DEBUG") == "1"
+
+    async def _setup_browser(self) -> tuple[BrowserContext, Page]:
+        """Check a pooled browser context out and open a page on it."""
+        context = await BrowserPool.get().acquire()
+        page = await self._new_page(context)
+
+        return context, page
+
+    async def _new_page(self, context: BrowserContext) -> Page:
+        """Open a page on a context with the agent's routing applied."""
         page = await context.new_page()
-        await page.route("**/*", lambda route: route.continue_())
-        
-        return browser, page
+        if self.BLOCK_RESOURCES:
+            await page.route(
+                "**/*",
+                lambda route: route.abort()
+                if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+                else route.continue_()
+            )
+        return page
+
+    @asynccontextmanager
+    async def _with_page(self, context: BrowserContext):
+        """Short-lived page on a long-lived context; pages open/close in ms
+        while the context (storage, route table) persists."""
+        page = await self._new_page(context)
+        try:
+            yield page
+        finally:
+            await page.close()
+
+    async def _scrape_urls(self, urls: List[str], handler, max_parallel: int = 4):
+        """Scrape several URLs in parallel pages on a single pooled context.
+
+        `handler(page, url)` does the per-page work; fan-out is bounded so a
+        large URL batch can't open unbounded pages on one context.
+        """
+        pool = BrowserPool.get()
+        context = await pool.acquire()
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def scrape_one(url: str):
+            async with semaphore:
+                async with self._with_page(context) as page:
+                    return await handler(page, url)
+
+        try:
+            return await asyncio.gather(*(scrape_one(url) for url in urls))
+        finally:
+            await pool.release(context)
+
+    async def _teardown_browser(self, context: BrowserContext, page: Page):
+        """Close the page and return its context to the pool."""
+        try:
+            await page.close()
+        except Exception as e:
+            logger.warning(f"Error closing page: {str(e)}")
+        finally:
+            await BrowserPool.get().release(context)
 
     async def _take_debug_screenshot(self, page: Page, source: str):
-        """Take a debug screenshot of the page."""
+        """Take a debug screenshot of the page (no-op unless SCRAPER_DEBUG=1)."""
+        if not self.debug_screenshots:
+            return
         try:
             await page.screenshot(path=f"debug-screenshot-{source}.png")
             logger.info(f"Debug screenshot saved for {source}")
@@ -46,26 +282,26 @@ class BaseTransferPortalAgent(ABC):
             logger.warning(f"Failed to save debug screenshot for {source}: {str(e)}")
 
     @abstractmethod
-    async def scrape_players(self) -> List[Dict[str, Any]]:
+    async def scrape_players(self) -> List[PlayerRecord]:
         """Scrape player data from the source."""
         pass
 
     def _parse_numeric_value(self, text: str, field_name: str, player_name: str) -> float:
         """Parse numeric values from text with error handling."""
-        try:
-            if text and text != "N/A":
-                return float(text.strip().replace("$", "").replace(",", ""))
+        if not text or text == "N/A":
             return 0.0
+        try:
+            return float(text.translate(_STRIP_TABLE))
         except ValueError:
             logger.warning(f"Invalid {field_name} value for player {player_name}: {text}")
             return 0.0
 
     def _parse_rank(self, text: str, player_name: str) -> int:
         """Parse rank values from text with error handling."""
-        try:
-            if text and text != "N/A":
-                return int(text.strip())
+        if not text or text == "N/A":
             return 0
+        try:
+            return int(text.translate(_STRIP_TABLE))
         except ValueError:
             logger.warning(f"Invalid rank value for player {player_name}: {text}")
             return 0 
\ No newline at end of file
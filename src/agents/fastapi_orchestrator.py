@@ -4,16 +4,25 @@ FastAPI Transfer Portal Orchestrator
 A simplified version of the orchestrator that focuses on core functionality.
 """
 import asyncio
+import hashlib
+import itertools
 import logging
+import os
 import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
-from fastapi import FastAPI, BackgroundTasks
+import orjson
+from fastapi import FastAPI, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from src.agents.base_agent import BROWSER_POOL_SIZE, BrowserPool, shutdown_playwright
 from src.agents.on3_agent import On3TransferPortalAgent
+from src.agents.rivals_agent import RivalsTransferPortalAgent
 
 # Configure logging
 logging.basicConfig(
@@ -23,13 +32,75 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="Transfer Portal API")
+app = FastAPI(title="Transfer Portal API", default_response_class=ORJSONResponse)
 
-# Global cache for player data
-player_cache = {
-    "data": [],
-    "last_updated": None
-}
+# How long clients may cache /players responses, in seconds (bounded staleness)
+PLAYERS_CACHE_TTL = int(os.environ.get("PLAYERS_CACHE_TTL", "60"))
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """
+    Immutable view of the player data plus its read indices.
+
+    Handlers read a single module-level reference that refresh_data rebinds
+    atomically, so data, indices and last_updated are always consistent with
+    each other — no window where one is updated and the others are not.
+    """
+    data: List[Dict] = field(default_factory=list)
+    last_updated: Optional[datetime] = None
+    by_position: Dict[str, List[int]] = field(default_factory=dict)
+    by_school: Dict[str, List[int]] = field(default_factory=dict)
+    etag: str = ""
+
+
+# Current snapshot of player data, swapped wholesale on each refresh
+current_snapshot = Snapshot()
+
+
+def _build_indices(players: List[Dict]):
+    """Build lowercase inverted indices (field value -> row indices) for the cache"""
+    by_position = defaultdict(list)
+    by_school = defaultdict(list)
+
+    for i, player in enumerate(players):
+        position = player.get("position", "").lower()
+        previous_school = player.get("previous_school", "").lower()
+        destination_school = (player.get("destination_school") or "").lower()
+
+        # Keep the lowercase projections on the row so any fallback
+        # substring matching doesn't have to re-lowercase per request
+        player["position_lc"] = position
+        player["previous_school_lc"] = previous_school
+        player["destination_school_lc"] = destination_school
+
+        if position:
+            by_position[position].append(i)
+        if previous_school:
+            by_school[previous_school].append(i)
+        if destination_school:
+            by_school[destination_school].append(i)
+
+    return by_position, by_school
+
+
+def _index_lookup(index: Dict[str, List[int]], query: str) -> set:
+    """Look up row indices for a query, preserving substring-match semantics"""
+    # Scan the (few) distinct keys, never the rows themselves. No exact-key
+    # shortcut: "michigan" must keep matching "michigan state" too
+    return {i for key, rows in index.items() if query in key for i in rows}
+
+
+def _build_snapshot(players: List[Dict]) -> Snapshot:
+    """Build a complete snapshot (data + indices) from freshly scraped rows"""
+    by_position, by_school = _build_indices(players)
+    last_updated = datetime.now()
+    return Snapshot(
+        data=players,
+        last_updated=last_updated,
+        by_position=by_position,
+        by_school=by_school,
+        etag=f'W/"{hashlib.blake2b(str(last_updated).encode(), digest_size=8).hexdigest()}"'
+    )
 
 
 class TransferPortalStats(BaseModel):
@@ -39,41 +110,109 @@ class TransferPortalStats(BaseModel):
     agent_status: str = "idle"
 
 
-# Create global agent instance
+# Create global agent instances
 portal_agent = On3TransferPortalAgent()
+rivals_agent = RivalsTransferPortalAgent()
+
+# Scraper agents to orchestrate; add new sources here. They run
+# concurrently against pooled contexts of one shared browser, so a
+# refresh costs max(t_i) across sources rather than sum(t_i)
+AGENTS = [portal_agent, rivals_agent]
+
+# Bound concurrent browser-using scrapes to the pool size so agent fan-out
+# can't exhaust the pooled contexts
+scrape_semaphore = asyncio.Semaphore(BROWSER_POOL_SIZE)
+
+
+async def _scrape_all_agents() -> List[Dict]:
+    """Scrape every configured agent concurrently with bounded fan-out"""
+    async def scrape_one(agent):
+        async with scrape_semaphore:
+            return await agent.scrape_players()
+
+    # TaskGroup cancels the remaining scrapes if one fails
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(scrape_one(agent)) for agent in AGENTS]
+
+    return list(itertools.chain.from_iterable(task.result() for task in tasks))
+
+# Single-writer guard for refreshes; checking a status string has a TOCTOU
+# window where two concurrent refreshes both launch scrapes
+refresh_lock = asyncio.Lock()
 
 
 async def refresh_data():
     """Background task to refresh the transfer portal data"""
+    if refresh_lock.locked():
+        logger.info("Refresh already running, skipping")
+        return
+    async with refresh_lock:
+        await _do_refresh()
+
+
+async def _do_refresh():
+    """Scrape, index and publish a new snapshot (caller holds refresh_lock)"""
+    global current_snapshot
     logger.info("Starting data refresh task")
     try:
         # Update status
         portal_stats.agent_status = "running"
-        
-        # Scrape players
-        start_time = time.time()
-        players = await portal_agent.scrape_players()
-        end_time = time.time()
-        
-        # Update cache
-        player_cache["data"] = players
-        player_cache["last_updated"] = datetime.now()
-        
-        # Update stats
+        _refresh_stats_json()
+
+        # Scrape players (perf_counter: monotonic, meant for durations)
+        start_time = time.perf_counter()
+        players = await _scrape_all_agents()
+        end_time = time.perf_counter()
+
+        # Build the snapshot (indexing is CPU work) off the event loop,
+        # then publish it with a single atomic rebind
+        current_snapshot = await asyncio.to_thread(_build_snapshot, players)
+
+        # Update stats, sharing the snapshot timestamp so the two never drift
         portal_stats.player_count = len(players)
-        portal_stats.last_updated = datetime.now()
+        portal_stats.last_updated = current_snapshot.last_updated
         portal_stats.agent_status = "ready"
-        
+        _refresh_stats_json()
+
         logger.info(f"Data refresh complete. Found {len(players)} players in {end_time - start_time:.2f} seconds")
         
     except Exception as e:
         portal_stats.agent_status = "error"
+        _refresh_stats_json()
         logger.error(f"Error refreshing data: {str(e)}")
 
 
 # Initialize statistics
 portal_stats = TransferPortalStats()
 
+# Serialized /stats body, rebuilt only when the stats actually change;
+# the endpoint then serves cached bytes instead of re-walking the model
+_stats_json: bytes = b"{}"
+
+
+def _refresh_stats_json():
+    """Re-serialize portal_stats after a mutation"""
+    global _stats_json
+    _stats_json = orjson.dumps(portal_stats.model_dump(mode="json"))
+
+
+_refresh_stats_json()
+
+
+# Timestamp string cached with one-second granularity; health probes arrive
+# several times a second and don't need sub-second precision
+_last_iso = ("", 0.0)
+
+
+def _now_iso() -> str:
+    global _last_iso
+    t = time.time()
+    if t - _last_iso[1] < 1.0:
+        return _last_iso[0]
+    s = datetime.now().isoformat()
+    _last_iso = (s, t)
+    return s
+
 
 @app.get("/health")
 async def health():
@@ -81,7 +220,7 @@ async def health():
     return {
         "status": "ok",
         "service": "Transfer Portal API",
-        "time": datetime.now().isoformat(),
+        "time": _now_iso(),
         "agent_status": portal_stats.agent_status
     }
 
@@ -89,41 +228,88 @@ async def health():
 @app.get("/stats")
 async def stats():
     """Get transfer portal statistics"""
-    return portal_stats
+    return Response(_stats_json, media_type="application/json")
+
+
+@app.get("/metrics")
+async def metrics():
+    """Get operational metrics, including browser pool health"""
+    return {
+        "browser_pool": BrowserPool.get().stats(),
+        "player_count": portal_stats.player_count,
+        "agent_status": portal_stats.agent_status
+    }
 
 
 @app.get("/players")
 async def get_players(
+    request: Request,
+    response: Response,
     limit: int = 20,
     position: Optional[str] = None,
-    school: Optional[str] = None
+    school: Optional[str] = None,
+    fields: Optional[str] = None
 ):
-    """Get players from the transfer portal with optional filtering"""
+    """Get players from the transfer portal with optional filtering.
+
+    `fields` is a comma-separated list of player keys to include; projecting
+    rows before serialization cuts response bytes and encoding CPU.
+    """
+    # Read one consistent snapshot for the whole request
+    snap = current_snapshot
+
+    # Honor conditional requests: unchanged data costs no serialization
+    if snap.etag and request.headers.get("if-none-match") == snap.etag:
+        return Response(status_code=304)
+
+    response.headers["ETag"] = snap.etag
+    response.headers["Cache-Control"] = f"public, max-age={PLAYERS_CACHE_TTL}"
+
     # If no data, return empty list
-    if not player_cache["data"]:
+    if not snap.data:
         return {"players": []}
-    
-    # Get data from cache
-    players = player_cache["data"]
-    
-    # Apply filters
-    if position:
-        players = [p for p in players if position.lower() in p.get("position", "").lower()]
-    
-    if school:
-        players = [
-            p for p in players 
-            if (school.lower() in p.get("previous_school", "").lower() or 
-                school.lower() in p.get("destination_school", "").lower())
-        ]
-    
-    # Apply limit
-    players = players[:limit]
-    
+
+    players = snap.data
+
+    # Apply filters via the pre-built indices (no per-request row scan)
+    if position or school:
+        if snap.by_position or snap.by_school:
+            idxs = None
+            if position:
+                idxs = _index_lookup(snap.by_position, position.lower())
+            if school:
+                school_idxs = _index_lookup(snap.by_school, school.lower())
+                idxs = school_idxs if idxs is None else idxs & school_idxs
+            players = [players[i] for i in sorted(idxs)[:limit]]
+        else:
+            # Fallback scan over the lowercase projections precomputed at
+            # refresh time. Lazy generators terminated by islice stop as
+            # soon as `limit` rows match, instead of materializing a full
+            # filtered list per predicate just to slice it.
+            it = iter(players)
+            if position:
+                pos_q = position.lower()
+                it = (p for p in it if pos_q in p.get("position_lc", ""))
+            if school:
+                school_q = school.lower()
+                it = (
+                    p for p in it
+                    if (school_q in p.get("previous_school_lc", "") or
+                        school_q in p.get("destination_school_lc", ""))
+                )
+            players = list(itertools.islice(it, limit))
+    else:
+        players = players[:limit]
+
+    # Project to the requested fields only (O(limit) work on the final rows)
+    if fields:
+        keys = fields.split(",")
+        players = [{k: p.get(k) for k in keys} for p in players]
+
     return {
         "count": len(players),
-        "total": len(player_cache["data"]),
-        "last_updated": player_cache["last_updated"],
+        "total": len(snap.data),
+        "last_updated": snap.last_updated,
         "players": players
     }
 
@@ -131,7 +317,7 @@ async def get_players(
 @app.post("/refresh")
 async def trigger_refresh(background_tasks: BackgroundTasks):
     """Trigger a manual refresh of the transfer portal data"""
-    if portal_stats.agent_status == "running":
+    if refresh_lock.locked():
         return {"status": "already_running"}
     
     background_tasks.add_task(refresh_data)
@@ -142,19 +328,30 @@ async def trigger_refresh(background_tasks: BackgroundTasks):
 async def startup_event():
     """Initialize the orchestrator when the API starts"""
     logger.info("Starting Transfer Portal API")
+    # Pre-launch the browser pool so the first scrape doesn't pay launch cost
+    await BrowserPool.get().start()
     # Trigger initial data refresh in the background
     asyncio.create_task(refresh_data())
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release browser resources when the API stops"""
+    await BrowserPool.get().stop()
+    await shutdown_playwright()
+
+
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting Transfer Portal API on port 9000...")
     try:
         uvicorn.run(
-            "src.agents.fastapi_orchestrator:app", 
-            host="0.0.0.0", 
-            port=9000, 
-            log_level="info"
+            "src.agents.fastapi_orchestrator:app",
+            host="0.0.0.0",
+            port=9000,
+            log_level="info",
+            loop="uvloop",
+            http="httptools"
         )
     except Exception as e:
         logger.error(f"Failed to start server: {str(e)}")
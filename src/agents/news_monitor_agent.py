@@ -14,19 +14,33 @@ Key capabilities:
 """
 
 import asyncio
+import concurrent.futures
 import datetime
+import functools
+import heapq
+import io
 import json
 import logging
+import operator
+import os
+import random
 import re
 import time
+from collections import Counter, defaultdict
 from dataclasses import asdict, dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
 
 import aiohttp
+import orjson
+from lxml import etree
+import xxhash
 from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field
-from playwright.async_api import async_playwright
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.agents.base_agent import get_playwright
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +50,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _parse_html(html: str) -> BeautifulSoup:
+    """Parse HTML with the C-backed lxml parser.
+
+    Without an explicit parser BeautifulSoup falls back to the pure-Python
+    html.parser, which is several times slower on the article listings the
+    scrapers chew through. All scraper methods should build their soup here.
+    """
+    return BeautifulSoup(html, "lxml")
+
+
 class NewsSource(str, Enum):
     """Enumeration of news sources to monitor"""
     ESPN = "espn"
@@ -75,28 +99,113 @@ class TransferEventType(str, Enum):
     DECOMMITMENT = "decommitment"
 
 
-class TransferNewsItem(BaseModel):
-    """Model for a transfer-related news item"""
+# Enum members snapshotted once; iterating the Enum class itself goes
+# through its metaclass __iter__ on every report call
+_EVENT_TYPES = tuple(TransferEventType)
+
+# Value -> member map for resolving API strings without EnumMeta __call__
+_EVENT_TYPE_BY_VALUE = {event_type.value: event_type for event_type in TransferEventType}
+
+# One bit per event type, so "does this item carry any of these events"
+# collapses from list scans into a single AND against a combined mask
+EVENT_BITS: Dict[TransferEventType, int] = {
+    event_type: 1 << i for i, event_type in enumerate(_EVENT_TYPES)
+}
+
+# Precompiled extraction patterns; per-call re.compile (and especially the
+# f-string-built patterns _determine_schools used) dominated on short texts.
+# Quote patterns inline the minimum-length filter so short matches are
+# rejected inside the regex engine rather than in a Python pass.
+_NAME_RE = re.compile(r"([A-Z][a-z]+ [A-Z][a-z]+)")
+_DQUOTE_RE = re.compile(r'"([^"]{16,})"')
+_SQUOTE_RE = re.compile(r"'([^']{16,})'")
+_PREV_CONTEXT_RE = re.compile(r"\b(?:from|of)\s+\(?([A-Z][A-Za-z &]+)\)?")
+_DEST_CONTEXT_RE = re.compile(r"\b(?:commits to|signs with|chooses|picks|to)\s+([A-Z][A-Za-z &]+)")
+
+# Keyword patterns indicating each transfer event type, matched case-insensitively
+EVENT_PATTERNS: Dict[TransferEventType, List[str]] = {
+    TransferEventType.PORTAL_ENTRY: ["enters portal", "enters transfer portal", "has entered the portal"],
+    TransferEventType.COMMITMENT: ["commits to", "committed to", "signs with", "chooses", "announces commitment"],
+    TransferEventType.VISIT_SCHEDULED: ["scheduled visit", "plans to visit", "official visit to", "visit scheduled"],
+    TransferEventType.VISIT_COMPLETED: ["completed visit", "visited", "after visiting", "following visit"],
+    TransferEventType.FINAL_LIST: ["final list", "top schools", "narrowed down", "finalists"],
+    TransferEventType.COACH_CHANGE: ["coach fired", "coaching change", "new coach", "head coach", "coaching staff"],
+    TransferEventType.NIL_RELATED: ["NIL deal", "NIL opportunity", "name, image and likeness", "NIL collective"],
+    TransferEventType.ACADEMIC_RELATED: ["academic", "degree", "graduate", "major", "education", "classroom"],
+    TransferEventType.PLAYING_TIME: ["playing time", "minutes", "starter", "bench", "rotation", "role"],
+    TransferEventType.FAMILY_RELATED: ["family", "closer to home", "parents", "child", "hometown"],
+    TransferEventType.GRADUATION_TRANSFER: ["graduate transfer", "fifth year", "sixth year", "grad transfer"],
+    TransferEventType.MEDICAL_RELATED: ["injury", "medical", "surgery", "recovery", "health"],
+    TransferEventType.DECOMMITMENT: ["decommits", "reopens recruitment", "backs out", "decommitment"]
+}
+
+# List of D1 basketball programs
+# This would be a much more comprehensive list in production
+SCHOOL_NAMES = [
+    "Duke", "North Carolina", "Kentucky", "Kansas", "UCLA", "Gonzaga",
+    "Michigan State", "Villanova", "Arizona", "Indiana", "Georgetown",
+    "Louisville", "Connecticut", "Syracuse", "Ohio State", "Michigan",
+    "Florida", "Wisconsin", "Purdue", "Illinois", "Alabama", "Auburn",
+    "Tennessee", "Texas", "Baylor", "Houston", "Arkansas", "Iowa State",
+    "Iowa", "Maryland", "Virginia", "North Carolina State", "Notre Dame"
+]
+
+
+@dataclass(slots=True)
+class TransferNewsItem:
+    """Model for a transfer-related news item.
+
+    A plain slotted dataclass rather than a pydantic model: the agent holds
+    and repeatedly sorts/filters thousands of these, and slots drop the
+    per-instance __dict__ while skipping validator dispatch on every
+    construction and attribute write. Values are validated at the scraping
+    boundary, not per instance.
+    """
     id: str
     player_name: str
     source_type: Union[NewsSource, SocialPlatform]
     source_name: str
     source_url: str
+    publication_date: str
     title: Optional[str] = None
     content_snippet: Optional[str] = None
-    publication_date: str
-    event_types: List[TransferEventType] = Field(default_factory=list)
+    # Epoch timestamp parsed once at ingestion; sort keys and date filters
+    # use this instead of re-parsing the ISO string per comparison
+    publication_ts: float = 0.0
+    event_types: List[TransferEventType] = field(default_factory=list)
+    # Bitwise OR of EVENT_BITS for event_types, filled at ingestion
+    event_mask: int = 0
     previous_school: Optional[str] = None
     destination_school: Optional[str] = None
-    mentioned_schools: List[str] = Field(default_factory=list)
+    mentioned_schools: List[str] = field(default_factory=list)
     confidence_score: float = 1.0  # 0.0 to 1.0
-    extracted_quotes: List[str] = Field(default_factory=list)
+    extracted_quotes: List[str] = field(default_factory=list)
     verified: bool = False
-    keywords: List[str] = Field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
+
+    def dict(self) -> Dict:
+        """Plain-dict view for JSON boundaries (pydantic-compatible name)"""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TextAnalysis:
+    """Every text-derived extraction for one piece of source text.
+
+    Frozen (and tuple-valued) so cached instances can be shared safely
+    between callers.
+    """
+    player_names: Tuple[str, ...]
+    schools: Tuple[str, ...]
+    quotes: Tuple[str, ...]
+    event_types: Tuple["TransferEventType", ...]
+    lower_text: str
 
 
 class NewsMonitorConfig(BaseModel):
     """Configuration for the news monitoring agent"""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
     news_sources: List[NewsSource] = Field(default_factory=list)
     social_platforms: List[SocialPlatform] = Field(default_factory=list)
     refresh_interval: int = 3600  # seconds
@@ -107,6 +216,45 @@ class NewsMonitorConfig(BaseModel):
     max_items_per_source: int = 100 
 
 
+def _reconcile_player(items: List[Dict]) -> List[Tuple[str, bool, float]]:
+    """Compute consensus verification/confidence updates for one player.
+
+    Runs in a worker process, so it takes plain dicts in and returns
+    (item id, verified, confidence_score) tuples out; the caller applies
+    the updates to the live items.
+    """
+    items.sort(key=lambda x: x["publication_date"], reverse=True)
+
+    # Identify the most common schools mentioned (Counter counts and picks
+    # the mode in C instead of a Python dict.get loop plus max scan)
+    prev_counter = Counter(i["previous_school"] for i in items if i["previous_school"])
+    dest_counter = Counter(i["destination_school"] for i in items if i["destination_school"])
+
+    most_common_prev = prev_counter.most_common(1)[0][0] if prev_counter else None
+    most_common_dest = dest_counter.most_common(1)[0][0] if dest_counter else None
+
+    updates = []
+    for item in items:
+        verified = item["verified"]
+        confidence = item["confidence_score"]
+        consistent_prev = item["previous_school"] == most_common_prev if most_common_prev else False
+        consistent_dest = item["destination_school"] == most_common_dest if most_common_dest else False
+
+        # If information is consistent across sources, mark as verified
+        if consistent_prev and consistent_dest and len(items) >= 3:
+            verified = True
+            confidence = min(1.0, confidence + 0.1)
+
+        # If information is inconsistent, reduce confidence
+        if (most_common_prev and item["previous_school"] and item["previous_school"] != most_common_prev) or \
+           (most_common_dest and item["destination_school"] and item["destination_school"] != most_common_dest):
+            confidence = max(0.3, confidence - 0.2)
+
+        updates.append((item["id"], verified, confidence))
+
+    return updates
+
+
 class NewsAndSocialMonitorAgent:
     """
     Agent for monitoring news and social media for basketball transfer information.
@@ -119,6 +267,37 @@ class NewsAndSocialMonitorAgent:
         self.news_items: Dict[str, TransferNewsItem] = {}
         self.last_refresh: Dict[Union[NewsSource, SocialPlatform], str] = {}
         self.school_aliases = self._load_school_aliases()
+
+        # One HTTP session shared by every scraper: keep-alive pooling means
+        # repeat requests to the same hosts skip TCP/TLS handshakes, and the
+        # bounded connector keeps DNS and file-descriptor use in check
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Cap in-flight fetches: one global ceiling so full fan-out across
+        # sources can't flood the loop, and a per-host cap so no single site
+        # sees enough concurrency to rate-limit us
+        self._global_sem = asyncio.Semaphore(20)
+        self._host_sems: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(4)
+        )
+
+        # Worker processes for CPU-bound post-processing; GIL-bound work run
+        # inline would stall the event loop under load
+        self._cpu_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count()
+        )
+
+        # Headless browser for the rendered-fetch fallback, launched lazily
+        # on the process-wide Playwright driver and shared across tasks;
+        # most news pages never need it
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+
+        # Secondary indexes over news_items, maintained at insert time so the
+        # query paths intersect small id sets instead of scanning every item
+        self._by_player: Dict[str, Set[str]] = defaultdict(set)
+        self._by_school: Dict[str, Set[str]] = defaultdict(set)
+        self._by_event: Dict[TransferEventType, Set[str]] = defaultdict(set)
         
         # Seed some keywords for better filtering
         self.transfer_keywords = [
@@ -129,7 +308,200 @@ class NewsAndSocialMonitorAgent:
             "coach hired", "coaching change", "NIL deal", "NIL opportunity",
             "playing time", "closer to home", "medical hardship"
         ] + self.config.additional_keywords
-    
+
+        self._build_token_scanner()
+
+        # Memoize full-text analysis per agent: retweets and syndicated
+        # blurbs repeat the same text across sources, and a cache hit skips
+        # the scan and regex passes entirely
+        self._analyze_text = functools.lru_cache(maxsize=4096)(self._analyze_text)
+
+    def _build_token_scanner(self):
+        """Compile one alternation over every keyword, school/alias and event
+        pattern so a single linear scan of lowercased text yields all hits,
+        instead of one substring pass per pattern."""
+        self._token_meanings: Dict[str, List[Tuple[str, object]]] = defaultdict(list)
+        # Lowercased alias/name -> canonical school name, for resolving a
+        # matched mention back to the school it refers to
+        self._alias_to_school: Dict[str, str] = {}
+
+        for keyword in self.transfer_keywords:
+            self._token_meanings[keyword.lower()].append(("keyword", keyword))
+
+        for school, aliases in self.school_aliases.items():
+            for alias in (school, *aliases):
+                meaning = ("school", school)
+                if meaning not in self._token_meanings[alias.lower()]:
+                    self._token_meanings[alias.lower()].append(meaning)
+                self._alias_to_school.setdefault(alias.lower(), school)
+
+        for school in SCHOOL_NAMES:
+            meaning = ("school", school)
+            if meaning not in self._token_meanings[school.lower()]:
+                self._token_meanings[school.lower()].append(meaning)
+            self._alias_to_school.setdefault(school.lower(), school)
+
+        for event_type, patterns in EVENT_PATTERNS.items():
+            for pattern in patterns:
+                self._token_meanings[pattern.lower()].append(("event", event_type))
+
+        # Longest tokens first so alternation prefers the most specific
+        # match; the word boundaries stop short aliases ("UK", "KU") from
+        # firing inside unrelated words
+        self._token_re = re.compile(
+            r"\b(?:"
+            + "|".join(
+                re.escape(token)
+                for token in sorted(self._token_meanings, key=len, reverse=True)
+            )
+            + r")\b"
+        )
+
+    def _scan_tokens(self, lower_text: str) -> Dict[str, Set]:
+        """Single pass over pre-lowercased text collecting keyword/school/event hits.
+
+        Takes text the caller has already lowercased (the scanner tokens are
+        stored lowercase) so no path lowercases the same string twice.
+        """
+        hits: Dict[str, Set] = {"keyword": set(), "school": set(), "event": set()}
+        if not lower_text:
+            return hits
+
+        for match in self._token_re.finditer(lower_text):
+            for kind, value in self._token_meanings[match.group(0)]:
+                hits[kind].add(value)
+
+        return hits
+
+    async def __aenter__(self) -> "NewsAndSocialMonitorAgent":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    limit_per_host=4,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    # Fetch retry policy: attempts and the backoff ceiling in seconds
+    _FETCH_ATTEMPTS = 4
+    _FETCH_MAX_BACKOFF = 8.0
+
+    async def _fetch_html(self, url: str) -> str:
+        """Fetch a page through the shared session with bounded concurrency.
+
+        Transient failures (timeouts, 429s, 5xx) are retried with jittered
+        exponential backoff, honoring a Retry-After header when the server
+        sends one, so a briefly rate-limited source is not written off for
+        the whole refresh cycle.
+        """
+        session = await self._get_session()
+        host = urlparse(url).hostname or ""
+        for attempt in range(self._FETCH_ATTEMPTS):
+            try:
+                async with self._global_sem, self._host_sems[host]:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        # Read to EOF so the connection returns to the pool
+                        return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                # Permanent client errors (403, 404, ...) will not heal
+                # with backoff; only 429 and server errors are retried
+                status = getattr(exc, "status", None)
+                if status is not None and status < 500 and status != 429:
+                    raise
+                if attempt == self._FETCH_ATTEMPTS - 1:
+                    raise
+                wait = min(0.5 * (2 ** attempt), self._FETCH_MAX_BACKOFF)
+                wait *= 0.5 + random.random()  # jitter to avoid lockstep retries
+                headers = getattr(exc, "headers", None)
+                retry_after = headers.get("Retry-After") if headers else None
+                if retry_after:
+                    try:
+                        wait = max(wait, float(retry_after))
+                    except ValueError:
+                        pass
+                logger.warning(
+                    f"Fetch of {url} failed (attempt {attempt + 1}): {exc}; retrying in {wait:.1f}s"
+                )
+                await asyncio.sleep(wait)
+
+    async def _fetch_rendered(self, url: str, wait_selector: Optional[str] = None) -> str:
+        """Fetch a page with the shared headless browser.
+
+        A browser run costs orders of magnitude more time and memory than a
+        static fetch, and sports news sites render their article lists
+        server-side. Scrapers should call _fetch_html first and fall back
+        here only when the expected selectors are missing from the static
+        HTML.
+        """
+        if self._browser is None:
+            async with self._browser_lock:
+                if self._browser is None:
+                    playwright = await get_playwright()
+                    self._browser = await playwright.chromium.launch(headless=True)
+
+        page = await self._browser.new_page()
+        try:
+            await page.goto(url)
+            if wait_selector:
+                await page.wait_for_selector(wait_selector)
+            return await page.content()
+        finally:
+            await page.close()
+
+    async def close(self):
+        """Release the shared HTTP session and browser"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+
+    def snapshot(self, path: Union[str, Path]) -> int:
+        """Write every news item to `path` for crash recovery.
+
+        orjson serializes the dataclass dicts (including the str-valued
+        enums) natively and several times faster than stdlib json, which
+        matters once the store holds thousands of items.
+        """
+        payload = orjson.dumps([asdict(item) for item in self.news_items.values()])
+        Path(path).write_bytes(payload)
+        return len(self.news_items)
+
+    def load(self, path: Union[str, Path]) -> int:
+        """Restore news items from a snapshot written by `snapshot`.
+
+        Items are re-indexed as they are inserted, so the secondary indexes
+        come back consistent with the store.
+        """
+        count = 0
+        for raw in orjson.loads(Path(path).read_bytes()):
+            try:
+                raw["source_type"] = NewsSource(raw["source_type"])
+            except ValueError:
+                raw["source_type"] = SocialPlatform(raw["source_type"])
+            raw["event_types"] = [TransferEventType(e) for e in raw["event_types"]]
+            item = TransferNewsItem(**raw)
+            self.news_items[item.id] = item
+            self._index_item(item)
+            count += 1
+        logger.info(f"Loaded {count} news items from {path}")
+        return count
+
     def _load_school_aliases(self) -> Dict[str, List[str]]:
         """Load aliases for school names to handle variations"""
         # In production, this would load from a file or database
@@ -147,33 +519,60 @@ class NewsAndSocialMonitorAgent:
             # Add more as needed
         }
     
-    def _generate_item_id(self, source_type: Union[NewsSource, SocialPlatform], 
+    def _generate_item_id(self, source_type: Union[NewsSource, SocialPlatform],
                          source_url: str, player_name: str) -> str:
         """Generate a unique ID for a news item"""
-        # Create a stable ID by hashing key components
-        import hashlib
-        input_str = f"{source_type}|{source_url}|{player_name}"
-        return hashlib.md5(input_str.encode()).hexdigest()
+        # The ID only needs to be stable, not cryptographic; xxh3 hashes
+        # short strings several times faster than MD5
+        return xxhash.xxh3_64_hexdigest(f"{source_type}|{source_url}|{player_name}")
     
+    def _index_item(self, item: TransferNewsItem):
+        """Add an item to the secondary indexes (idempotent per id)"""
+        if not item.publication_ts and item.publication_date:
+            try:
+                item.publication_ts = datetime.datetime.fromisoformat(
+                    item.publication_date.replace('Z', '+00:00')
+                ).timestamp()
+            except ValueError:
+                logger.warning(f"Unparseable publication date on item {item.id}: {item.publication_date}")
+        if not item.event_mask and item.event_types:
+            for event_type in item.event_types:
+                item.event_mask |= EVENT_BITS[event_type]
+        self._by_player[item.player_name.lower()].add(item.id)
+        for school in {item.previous_school, item.destination_school,
+                       *item.mentioned_schools}:
+            if school:
+                self._by_school[school.lower()].add(item.id)
+        for event_type in item.event_types:
+            self._by_event[event_type].add(item.id)
+
+    @staticmethod
+    def _ids_matching(index: Dict[str, Set[str]], query: str) -> Set[str]:
+        """Collect ids for a query, preserving substring-match semantics"""
+        # Always substring-scan the distinct keys; an exact-key shortcut
+        # would stop "John Smith" from matching "John Smithson"
+        return {item_id for key, ids in index.items() if query in key
+                for item_id in ids}
+
     async def refresh_all_sources(self):
         """Refresh data from all configured sources"""
         logger.info("Starting refresh of all news and social sources")
         
-        tasks = []
-        
-        # Add tasks for news sources
-        for source in self.config.news_sources:
-            tasks.append(self.refresh_news_source(source))
-        
-        # Add tasks for social platforms
-        for platform in self.config.social_platforms:
-            tasks.append(self.refresh_social_platform(platform))
-        
-        # Run all tasks and collect results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Run every source concurrently under one TaskGroup. Per-source
+        # errors are absorbed inside the refresh methods (which return 0),
+        # so a failing source cannot cancel its siblings
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self.refresh_news_source(source))
+                for source in self.config.news_sources
+            ]
+            tasks += [
+                tg.create_task(self.refresh_social_platform(platform))
+                for platform in self.config.social_platforms
+            ]
         
         # Count successful sources
-        successful = sum(1 for result in results if isinstance(result, int) and result > 0)
+        successful = sum(1 for task in tasks if task.result() > 0)
         logger.info(f"Completed refresh of {successful}/{len(tasks)} sources")
         
         # Process and consolidate the news items
@@ -208,9 +607,10 @@ class NewsAndSocialMonitorAgent:
                 # Generic approach for other sources
                 items = await self._scrape_generic_news(source)
             
-            # Add items to the collection
+            # Add items to the collection and index them for queries
             for item in items:
                 self.news_items[item.id] = item
+                self._index_item(item)
             
             logger.info(f"Retrieved {len(items)} items from {source}")
             return len(items)
@@ -238,9 +638,10 @@ class NewsAndSocialMonitorAgent:
                 # Generic approach for other platforms
                 items = await self._scrape_generic_social(platform)
             
-            # Add items to the collection
+            # Add items to the collection and index them for queries
             for item in items:
                 self.news_items[item.id] = item
+                self._index_item(item)
             
             logger.info(f"Retrieved {len(items)} items from {platform}")
             return len(items)
@@ -277,8 +678,46 @@ class NewsAndSocialMonitorAgent:
         # This would be a full implementation in production
         return items
     
+    def _iter_feed_entries(self, data: bytes, max_items: Optional[int] = None):
+        """Stream RSS/Atom entries out of raw feed bytes.
+
+        iterparse yields each <item>/<entry> as it closes and the loop
+        clears consumed elements, so peak memory stays at one entry no
+        matter how large the feed is — and the early exit means the tail
+        of a huge feed is never parsed at all.
+        """
+        if max_items is None:
+            max_items = self.config.max_items_per_source
+        count = 0
+        # Wildcard namespaces: Atom entries are always namespaced, so a
+        # bare "entry" tag filter would match nothing for Atom feeds
+        for _, elem in etree.iterparse(io.BytesIO(data), events=("end",),
+                                       tag=("{*}item", "{*}entry")):
+            entry = {}
+            for child in elem:
+                # Comments and processing instructions have non-string
+                # tags that make QName raise
+                if not isinstance(child.tag, str):
+                    continue
+                tag = etree.QName(child).localname
+                if tag in ("title", "link", "description", "summary",
+                           "pubDate", "published", "updated"):
+                    entry[tag] = (child.text or "").strip()
+            yield entry
+            # Drop the processed subtree and its already-consumed siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            count += 1
+            if count >= max_items:
+                break
+
     async def _scrape_generic_news(self, source: NewsSource) -> List[TransferNewsItem]:
-        """Generic scraper for news sources"""
+        """Generic scraper for news sources.
+
+        Feed-backed sources should fetch bytes and run them through
+        _iter_feed_entries rather than building a full DOM per page.
+        """
         # This is a placeholder for a more complete implementation
         logger.info(f"Generic scraping for {source} (placeholder implementation)")
         return []
@@ -327,8 +766,7 @@ class NewsAndSocialMonitorAgent:
         
         # Simple pattern for detecting names (First Last)
         # This is a simplified approach and would need refinement in production
-        name_pattern = r'([A-Z][a-z]+ [A-Z][a-z]+)'
-        potential_names = re.findall(name_pattern, text)
+        potential_names = _NAME_RE.findall(text)
         
         # Filter out common non-player phrases
         filtered_names = []
@@ -350,189 +788,125 @@ class NewsAndSocialMonitorAgent:
         """Extract mentions of schools from text"""
         if not text:
             return []
-        
-        # List of D1 basketball programs
-        # This would be a much more comprehensive list in production
-        school_names = [
-            "Duke", "North Carolina", "Kentucky", "Kansas", "UCLA", "Gonzaga", 
-            "Michigan State", "Villanova", "Arizona", "Indiana", "Georgetown", 
-            "Louisville", "Connecticut", "Syracuse", "Ohio State", "Michigan", 
-            "Florida", "Wisconsin", "Purdue", "Illinois", "Alabama", "Auburn", 
-            "Tennessee", "Texas", "Baylor", "Houston", "Arkansas", "Iowa State", 
-            "Iowa", "Maryland", "Virginia", "North Carolina State", "Notre Dame"
-        ]
-        
-        # Check for school names and their aliases
-        mentioned_schools = []
-        for school, aliases in self.school_aliases.items():
-            if school in text:
-                mentioned_schools.append(school)
-                continue
-                
-            for alias in aliases:
-                if alias in text:
-                    mentioned_schools.append(school)
-                    break
-        
-        # Check for other schools in the list
-        for school in school_names:
-            if school in text and school not in mentioned_schools:
-                mentioned_schools.append(school)
-        
-        return mentioned_schools
+
+        return list(self._scan_tokens(text.lower())["school"])
     
     def _extract_quotes(self, text: str) -> List[str]:
         """Extract quoted statements from text"""
         if not text:
             return []
         
-        # Find text between quotation marks
-        quote_pattern = r'"([^"]*)"'
-        quotes = re.findall(quote_pattern, text)
-        
-        # Also find text with single quotes
-        single_quote_pattern = r"'([^']*)'"
-        single_quotes = re.findall(single_quote_pattern, text)
-        
-        # Combine and filter for minimum length (avoid short expressions)
-        all_quotes = quotes + single_quotes
-        filtered_quotes = [q for q in all_quotes if len(q) > 15]
-        
-        return filtered_quotes
+        # Find text between double or single quotation marks; the minimum
+        # length (avoid short expressions) is enforced by the patterns
+        return _DQUOTE_RE.findall(text) + _SQUOTE_RE.findall(text)
     
     def _detect_event_types(self, title: Optional[str], content: Optional[str]) -> List[TransferEventType]:
         """Detect types of transfer events mentioned in the content"""
-        event_types = []
         combined_text = ""
-        
+
         if title:
             combined_text += title + " "
         if content:
             combined_text += content
-            
+
         if not combined_text:
-            return event_types
-            
-        # Check for each event type using keyword patterns
-        event_patterns = {
-            TransferEventType.PORTAL_ENTRY: ["enters portal", "enters transfer portal", "has entered the portal"],
-            TransferEventType.COMMITMENT: ["commits to", "committed to", "signs with", "chooses", "announces commitment"],
-            TransferEventType.VISIT_SCHEDULED: ["scheduled visit", "plans to visit", "official visit to", "visit scheduled"],
-            TransferEventType.VISIT_COMPLETED: ["completed visit", "visited", "after visiting", "following visit"],
-            TransferEventType.FINAL_LIST: ["final list", "top schools", "narrowed down", "finalists"],
-            TransferEventType.COACH_CHANGE: ["coach fired", "coaching change", "new coach", "head coach", "coaching staff"],
-            TransferEventType.NIL_RELATED: ["NIL deal", "NIL opportunity", "name, image and likeness", "NIL collective"],
-            TransferEventType.ACADEMIC_RELATED: ["academic", "degree", "graduate", "major", "education", "classroom"],
-            TransferEventType.PLAYING_TIME: ["playing time", "minutes", "starter", "bench", "rotation", "role"],
-            TransferEventType.FAMILY_RELATED: ["family", "closer to home", "parents", "child", "hometown"],
-            TransferEventType.GRADUATION_TRANSFER: ["graduate transfer", "fifth year", "sixth year", "grad transfer"],
-            TransferEventType.MEDICAL_RELATED: ["injury", "medical", "surgery", "recovery", "health"],
-            TransferEventType.DECOMMITMENT: ["decommits", "reopens recruitment", "backs out", "decommitment"]
-        }
-        
-        for event_type, patterns in event_patterns.items():
-            for pattern in patterns:
-                if pattern.lower() in combined_text.lower():
-                    event_types.append(event_type)
-                    break
-        
-        return event_types
+            return []
+
+        hits = self._scan_tokens(combined_text.lower())["event"]
+        # Preserve the declaration order of the enum in the result
+        return [event_type for event_type in EVENT_PATTERNS if event_type in hits]
     
+    def _analyze_text(self, text: str) -> TextAnalysis:
+        """Run every text-derived extraction over one source text.
+
+        One token-scan pass yields schools and event types; the name and
+        quote regexes each make one more pass. Wrapped in a per-agent
+        lru_cache in __init__, so repeated snippets are analyzed once.
+        """
+        lower_text = text.lower() if text else ""
+        hits = self._scan_tokens(lower_text)
+        return TextAnalysis(
+            player_names=tuple(self._extract_player_names(text)),
+            schools=tuple(hits["school"]),
+            quotes=tuple(self._extract_quotes(text)),
+            event_types=tuple(et for et in EVENT_PATTERNS if et in hits["event"]),
+            lower_text=lower_text
+        )
+
+    def _resolve_school(self, capture: str) -> Optional[str]:
+        """Resolve a regex capture to a canonical school name.
+
+        Longest word prefix wins so "Michigan State fans" resolves to
+        Michigan State rather than Michigan; lookups hit the prebuilt
+        alias map instead of scanning school lists.
+        """
+        words = capture.lower().split()
+        for end in range(min(len(words), 4), 0, -1):
+            school = self._alias_to_school.get(" ".join(words[:end]))
+            if school:
+                return school
+        return None
+
     def _determine_schools(self, player_name: str, text: str, mentioned_schools: List[str]) -> Tuple[Optional[str], Optional[str]]:
         """Determine previous and destination schools for a player"""
         if not text or not player_name or not mentioned_schools:
             return None, None
             
+        # Locate the player once and work on a window around the mention
+        # instead of interpolating the name into fresh regexes per call;
+        # school talk can precede the name, so the window extends both ways
+        idx = text.find(player_name)
+        if idx == -1:
+            return None, None
+        window = text[max(0, idx - 200):idx + len(player_name) + 200]
+
         previous_school = None
         destination_school = None
-        
+
         # Look for patterns indicating previous school
-        prev_patterns = [
-            f"{player_name} from ([A-Za-z ]+)",
-            f"{player_name}, from ([A-Za-z ]+)",
-            f"{player_name} of ([A-Za-z ]+)",
-            f"{player_name} \(([A-Za-z ]+)\)"
-        ]
-        
-        for pattern in prev_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                for school in mentioned_schools:
-                    if school.lower() in match.lower():
-                        previous_school = school
-                        break
-                if previous_school:
-                    break
+        for match in _PREV_CONTEXT_RE.findall(window):
+            previous_school = self._resolve_school(match)
             if previous_school:
                 break
-        
+
         # Look for patterns indicating destination school
-        dest_patterns = [
-            f"{player_name} to ([A-Za-z ]+)",
-            f"{player_name} commits to ([A-Za-z ]+)",
-            f"{player_name} chooses ([A-Za-z ]+)",
-            f"{player_name} picks ([A-Za-z ]+)",
-            f"{player_name} signs with ([A-Za-z ]+)"
-        ]
-        
-        for pattern in dest_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                for school in mentioned_schools:
-                    if school.lower() in match.lower():
-                        destination_school = school
-                        break
-                if destination_school:
-                    break
+        for match in _DEST_CONTEXT_RE.findall(window):
+            destination_school = self._resolve_school(match)
             if destination_school:
                 break
-        
+
         return previous_school, destination_school
     
     async def _post_process_news_items(self):
         """Post-process collected news items to improve quality and remove duplicates"""
-        # Identify duplicate information about the same player
-        player_events = {}
-        
-        for item_id, item in self.news_items.items():
-            if item.player_name not in player_events:
-                player_events[item.player_name] = []
+        # Group duplicate information about the same player
+        player_events: Dict[str, List[TransferNewsItem]] = defaultdict(list)
+        for item in self.news_items.values():
             player_events[item.player_name].append(item)
-        
-        # For each player, verify information across multiple sources when possible
-        for player_name, items in player_events.items():
-            if len(items) > 1:
-                # Sort by publication date (newest first)
-                items.sort(key=lambda x: x.publication_date, reverse=True)
-                
-                # Identify the most common schools mentioned
-                prev_schools = {}
-                dest_schools = {}
-                
-                for item in items:
-                    if item.previous_school:
-                        prev_schools[item.previous_school] = prev_schools.get(item.previous_school, 0) + 1
-                    if item.destination_school:
-                        dest_schools[item.destination_school] = dest_schools.get(item.destination_school, 0) + 1
-                
-                # Find the most frequently mentioned schools
-                most_common_prev = max(prev_schools.items(), key=lambda x: x[1])[0] if prev_schools else None
-                most_common_dest = max(dest_schools.items(), key=lambda x: x[1])[0] if dest_schools else None
-                
-                # If there's consensus, increase confidence for consistent items
-                for item in items:
-                    consistent_prev = item.previous_school == most_common_prev if most_common_prev else False
-                    consistent_dest = item.destination_school == most_common_dest if most_common_dest else False
-                    
-                    # If information is consistent across sources, mark as verified
-                    if consistent_prev and consistent_dest and len(items) >= 3:
-                        item.verified = True
-                        item.confidence_score = min(1.0, item.confidence_score + 0.1)
-                    
-                    # If information is inconsistent, reduce confidence
-                    if (most_common_prev and item.previous_school and item.previous_school != most_common_prev) or \
-                       (most_common_dest and item.destination_school and item.destination_school != most_common_dest):
-                        item.confidence_score = max(0.3, item.confidence_score - 0.2)
+
+        # Only players seen in multiple items need cross-source reconciliation
+        groups = [items for items in player_events.values() if len(items) > 1]
+        if not groups:
+            return
+
+        # The reconciliation is pure Python CPU work; with many players it
+        # would stall the event loop and every scraper on it. Each group is
+        # independent, so fan them out across the worker processes and apply
+        # the returned updates here.
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(
+                self._cpu_pool, _reconcile_player, [asdict(item) for item in items]
+            )
+            for items in groups
+        ])
+
+        for updates in results:
+            for item_id, verified, confidence in updates:
+                item = self.news_items.get(item_id)
+                if item is not None:
+                    item.verified = verified
+                    item.confidence_score = confidence
     
     def query_news_items(self, 
                         player_name: Optional[str] = None,
@@ -545,48 +919,64 @@ class NewsAndSocialMonitorAgent:
         """Query the collected news items based on filters"""
         # Calculate the earliest date to include
         earliest_date = datetime.datetime.now() - datetime.timedelta(days=days_back)
-        
-        # Start with all items
-        items = list(self.news_items.values())
-        
-        # Apply filters
+
+        # Resolve the indexed filters to candidate id sets and intersect,
+        # so the remaining filters only touch matching items
+        item_ids = None
         if player_name:
-            items = [item for item in items if player_name.lower() in item.player_name.lower()]
-        
+            item_ids = self._ids_matching(self._by_player, player_name.lower())
         if school:
-            items = [item for item in items if 
-                     (item.previous_school and school.lower() in item.previous_school.lower()) or
-                     (item.destination_school and school.lower() in item.destination_school.lower()) or
-                     any(school.lower() in s.lower() for s in item.mentioned_schools)]
-        
+            school_ids = self._ids_matching(self._by_school, school.lower())
+            item_ids = school_ids if item_ids is None else item_ids & school_ids
         if event_type:
-            items = [item for item in items if event_type in item.event_types]
-        
+            event_ids = self._by_event.get(event_type, set())
+            item_ids = set(event_ids) if item_ids is None else item_ids & event_ids
+
+        if item_ids is None:
+            items = list(self.news_items.values())
+        else:
+            items = [self.news_items[item_id] for item_id in item_ids
+                     if item_id in self.news_items]
+
         if min_confidence > 0.0:
             items = [item for item in items if item.confidence_score >= min_confidence]
         
         if verified_only:
             items = [item for item in items if item.verified]
         
-        # Filter by date
-        items = [item for item in items if 
-                 datetime.datetime.fromisoformat(item.publication_date.replace('Z', '+00:00')) >= earliest_date]
-        
-        # Sort by publication date (newest first) and confidence
-        items.sort(key=lambda x: (datetime.datetime.fromisoformat(x.publication_date.replace('Z', '+00:00')), x.confidence_score), reverse=True)
-        
-        # Apply limit
+        # Filter by date using the precomputed epoch timestamps
+        earliest_ts = earliest_date.timestamp()
+        items = [item for item in items if item.publication_ts >= earliest_ts]
+
+        # Newest first, confidence as tiebreak. When a limit applies, a
+        # bounded heap selection is O(N log limit) instead of a full sort.
+        sort_key = operator.attrgetter("publication_ts", "confidence_score")
         if limit > 0:
-            items = items[:limit]
+            items = heapq.nlargest(limit, items, key=sort_key)
+        else:
+            items.sort(key=sort_key, reverse=True)
         
         return items
     
+    def get_news_for_player(self, player_name: str) -> List[TransferNewsItem]:
+        """All items naming a player, straight off the exact-name index.
+
+        O(hits) per call — integration code that walks the whole portal
+        roster should use this rather than query_news_items, which applies
+        date windows and sorting the integration pass does not need.
+        """
+        ids = self._by_player.get(player_name.lower())
+        if not ids:
+            return []
+        return [self.news_items[item_id] for item_id in ids
+                if item_id in self.news_items]
+
     def get_player_timeline(self, player_name: str) -> List[TransferNewsItem]:
         """Get a chronological timeline of events for a specific player"""
         items = self.query_news_items(player_name=player_name, limit=0)
         
         # Sort chronologically (oldest first)
-        items.sort(key=lambda x: datetime.datetime.fromisoformat(x.publication_date.replace('Z', '+00:00')))
+        items.sort(key=operator.attrgetter("publication_ts"))
         
         return items
     
@@ -599,16 +989,14 @@ class NewsAndSocialMonitorAgent:
         incoming = [item for item in items if item.destination_school and school.lower() in item.destination_school.lower()]
         outgoing = [item for item in items if item.previous_school and school.lower() in item.previous_school.lower()]
         
-        # Count by event type
-        event_counts = {}
-        for event_type in TransferEventType:
-            event_counts[event_type] = len([item for item in items if event_type in item.event_types])
+        # Count by event type in one pass over the items, keeping zero
+        # counts for event types that never occur
+        counts = Counter(et for item in items for et in item.event_types)
+        event_counts = {event_type: counts[event_type] for event_type in _EVENT_TYPES}
         
         # Group by player
-        player_items = {}
+        player_items = defaultdict(list)
         for item in items:
-            if item.player_name not in player_items:
-                player_items[item.player_name] = []
             player_items[item.player_name].append(item)
         
         # Build response
@@ -619,7 +1007,7 @@ class NewsAndSocialMonitorAgent:
             "outgoing_transfers": len(outgoing),
             "event_counts": event_counts,
             "players_mentioned": list(player_items.keys()),
-            "latest_news": sorted(items, key=lambda x: datetime.datetime.fromisoformat(x.publication_date.replace('Z', '+00:00')), reverse=True)[:5]
+            "latest_news": heapq.nlargest(5, items, key=operator.attrgetter("publication_ts"))
         }
     
     def detect_coaching_changes(self) -> List[Dict]:
@@ -628,18 +1016,16 @@ class NewsAndSocialMonitorAgent:
         items = self.query_news_items(event_type=TransferEventType.COACH_CHANGE, limit=0)
         
         # Group by school
-        school_items = {}
+        school_items = defaultdict(list)
         for item in items:
             for school in item.mentioned_schools:
-                if school not in school_items:
-                    school_items[school] = []
                 school_items[school].append(item)
         
         # Create summaries for each school
         results = []
         for school, news_items in school_items.items():
             # Sort by date (newest first)
-            news_items.sort(key=lambda x: datetime.datetime.fromisoformat(x.publication_date.replace('Z', '+00:00')), reverse=True)
+            news_items.sort(key=operator.attrgetter("publication_ts"), reverse=True)
             
             results.append({
                 "school": school,
@@ -649,7 +1035,7 @@ class NewsAndSocialMonitorAgent:
             })
         
         # Sort by confidence (highest first)
-        results.sort(key=lambda x: x["confidence"], reverse=True)
+        results.sort(key=operator.itemgetter("confidence"), reverse=True)
         
         return results
     
@@ -658,46 +1044,48 @@ class NewsAndSocialMonitorAgent:
         # This would be more sophisticated in production
         all_items = list(self.news_items.values())
         
-        # Count events by type
-        event_counts = {}
-        for event_type in TransferEventType:
-            event_counts[event_type] = len([item for item in all_items if event_type in item.event_types])
-        
-        # Count transfers by school
-        school_counts = {}
-        for item in all_items:
-            # Count as destination school if available
-            if item.destination_school:
-                if item.destination_school not in school_counts:
-                    school_counts[item.destination_school] = {"incoming": 0, "outgoing": 0}
-                school_counts[item.destination_school]["incoming"] += 1
-            
-            # Count as previous school if available
-            if item.previous_school:
-                if item.previous_school not in school_counts:
-                    school_counts[item.previous_school] = {"incoming": 0, "outgoing": 0}
-                school_counts[item.previous_school]["outgoing"] += 1
+        # Count events by type in one pass over the items, keeping zero
+        # counts for event types that never occur
+        counts = Counter(et for item in all_items for et in item.event_types)
+        event_counts = {event_type: counts[event_type] for event_type in _EVENT_TYPES}
+        
+        # Count transfers by school with two C-level Counter builds over
+        # generator filters, instead of per-item dict increments in Python
+        incoming = Counter(
+            item.destination_school for item in all_items if item.destination_school
+        )
+        outgoing = Counter(
+            item.previous_school for item in all_items if item.previous_school
+        )
+        school_counts = {
+            school: {"incoming": incoming[school], "outgoing": outgoing[school]}
+            for school in incoming.keys() | outgoing.keys()
+        }
+        
+        # Decorate each school with its totals once, then select with
+        # C-level itemgetter keys: the arithmetic runs once per school
+        # instead of once per comparison inside a Python lambda
+        stats = [
+            (school, counts, counts["incoming"] + counts["outgoing"],
+             counts["incoming"] - counts["outgoing"])
+            for school, counts in school_counts.items()
+        ]
+        school_pair = operator.itemgetter(0, 1)
         
         # Find schools with most activity
-        active_schools = sorted(
-            school_counts.items(), 
-            key=lambda x: x[1]["incoming"] + x[1]["outgoing"], 
-            reverse=True
-        )[:10]
+        active_schools = [
+            school_pair(t) for t in heapq.nlargest(10, stats, key=operator.itemgetter(2))
+        ]
         
         # Find schools with highest net incoming transfers
-        net_gain_schools = sorted(
-            school_counts.items(),
-            key=lambda x: x[1]["incoming"] - x[1]["outgoing"],
-            reverse=True
-        )[:5]
+        net_gain_schools = [
+            school_pair(t) for t in heapq.nlargest(5, stats, key=operator.itemgetter(3))
+        ]
         
         # Find schools with highest net outgoing transfers
-        net_loss_schools = sorted(
-            school_counts.items(),
-            key=lambda x: x[1]["outgoing"] - x[1]["incoming"],
-            reverse=True
-        )[:5]
+        net_loss_schools = [
+            school_pair(t) for t in heapq.nsmallest(5, stats, key=operator.itemgetter(3))
+        ]
         
         return {
             "total_news_items": len(all_items),
@@ -716,26 +1104,43 @@ class NewsMonitorMCPAdapter:
     
     def __init__(self, agent: NewsAndSocialMonitorAgent):
         self.agent = agent
+        # item id -> ((verified, confidence_score), dict view); result sets
+        # repeat the same items across requests, so the asdict walk is paid
+        # once per item per post-processing state
+        self._dict_cache: Dict[str, Tuple[Tuple[bool, float], Dict]] = {}
+    
+    def _serialize(self, item: TransferNewsItem) -> Dict:
+        """Dict view of an item, cached by id and invalidated when the
+        post-processing-mutable fields change"""
+        state = (item.verified, item.confidence_score)
+        cached = self._dict_cache.get(item.id)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        d = item.dict()
+        self._dict_cache[item.id] = (state, d)
+        return d
     
     async def refresh_data(self):
         """Refresh data from all sources"""
         return await self.agent.refresh_all_sources()
     
-    def query_news_items(self, query_params: Dict) -> List[Dict]:
-        """Query news items with the given parameters"""
+    def _query(self, query_params: Dict) -> List[TransferNewsItem]:
+        """Run a query from loosely-typed params against the agent"""
         # Convert dict params to expected types
         player_name = query_params.get('player_name')
         school = query_params.get('school')
         event_type = query_params.get('event_type')
-        if event_type:
-            event_type = TransferEventType(event_type)
+        if event_type and not isinstance(event_type, TransferEventType):
+            resolved = _EVENT_TYPE_BY_VALUE.get(event_type)
+            if resolved is None:
+                raise ValueError(f"{event_type!r} is not a valid TransferEventType")
+            event_type = resolved
         min_confidence = float(query_params.get('min_confidence', 0.0))
         verified_only = bool(query_params.get('verified_only', False))
         days_back = int(query_params.get('days_back', 7))
         limit = int(query_params.get('limit', 20))
         
-        # Get items from agent
-        items = self.agent.query_news_items(
+        return self.agent.query_news_items(
             player_name=player_name,
             school=school,
             event_type=event_type,
@@ -744,14 +1149,24 @@ class NewsMonitorMCPAdapter:
             days_back=days_back,
             limit=limit
         )
-        
-        # Convert to dicts
-        return [item.dict() for item in items]
     
+    def query_news_items(self, query_params: Dict) -> List[Dict]:
+        """Query news items with the given parameters"""
+        return [self._serialize(item) for item in self._query(query_params)]
+    
+    def iter_news_items(self, query_params: Dict):
+        """Yield serialized query results one item at a time.
+
+        Streaming consumers (NDJSON endpoints) get one dict per item, so
+        the full serialized result set never exists in memory at once.
+        """
+        for item in self._query(query_params):
+            yield self._serialize(item)
+
     def get_player_timeline(self, player_name: str) -> List[Dict]:
         """Get timeline for a player"""
         items = self.agent.get_player_timeline(player_name)
-        return [item.dict() for item in items]
+        return [self._serialize(item) for item in items]
     
     def get_school_activity(self, school: str) -> Dict:
         """Get activity for a school"""
@@ -759,7 +1174,7 @@ class NewsMonitorMCPAdapter:
         
         # Convert news items to dicts
         if 'latest_news' in result:
-            result['latest_news'] = [item.dict() for item in result['latest_news']]
+            result['latest_news'] = [self._serialize(item) for item in result['latest_news']]
         
         return result
     
@@ -770,7 +1185,7 @@ class NewsMonitorMCPAdapter:
         # Convert news items to dicts
         for result in results:
             if 'latest_news' in result and result['latest_news']:
-                result['latest_news'] = result['latest_news'].dict()
+                result['latest_news'] = self._serialize(result['latest_news'])
         
         return results
     
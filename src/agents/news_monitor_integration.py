@@ -8,10 +8,14 @@ of transfer activities before they appear in official portals.
 
 import asyncio
 import logging
+import operator
+import sys
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
 from src.agents.news_monitor_agent import (
+    EVENT_BITS,
     NewsAndSocialMonitorAgent,
     NewsMonitorConfig,
     NewsMonitorMCPAdapter,
@@ -21,6 +25,12 @@ from src.agents.news_monitor_agent import (
     TransferNewsItem
 )
 
+# Combined masks for the event checks the integration pass makes per item
+_COMMIT_OR_PORTAL_BITS = (
+    EVENT_BITS[TransferEventType.COMMITMENT] | EVENT_BITS[TransferEventType.PORTAL_ENTRY]
+)
+_PORTAL_BIT = EVENT_BITS[TransferEventType.PORTAL_ENTRY]
+
 from src.agents.transfer_portal_orchestrator import (
     TransferPortalOrchestrator,
     DataSource,
@@ -42,6 +52,18 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
     with the transfer portal information.
     """
     
+    # Programs to track in news, built once at import with interned
+    # strings so downstream equality checks compare by pointer first.
+    # In production this would come from configuration or a database.
+    _TRACKED_PROGRAMS = tuple(sys.intern(s) for s in (
+        "Duke", "North Carolina", "Kentucky", "Kansas", "UCLA", "Gonzaga",
+        "Michigan State", "Villanova", "Arizona", "Indiana", "Georgetown",
+        "Louisville", "Connecticut", "Syracuse", "Ohio State", "Michigan",
+        "Florida", "Wisconsin", "Purdue", "Illinois", "Alabama", "Auburn",
+        "Tennessee", "Texas", "Baylor", "Houston", "Arkansas", "Iowa State",
+        "Iowa", "Maryland", "Virginia"
+    ))
+    
     def __init__(self, refresh_interval: int = 3600, news_refresh_interval: int = 3600):
         """Initialize the extended orchestrator"""
         # Initialize the base orchestrator
@@ -74,16 +96,7 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
     
     def _get_tracked_programs(self) -> List[str]:
         """Get the list of programs to track in news"""
-        # In a production environment, this would likely come from a configuration file
-        # or database, but for this example we'll hardcode some major programs
-        return [
-            "Duke", "North Carolina", "Kentucky", "Kansas", "UCLA", "Gonzaga", 
-            "Michigan State", "Villanova", "Arizona", "Indiana", "Georgetown", 
-            "Louisville", "Connecticut", "Syracuse", "Ohio State", "Michigan", 
-            "Florida", "Wisconsin", "Purdue", "Illinois", "Alabama", "Auburn", 
-            "Tennessee", "Texas", "Baylor", "Houston", "Arkansas", "Iowa State", 
-            "Iowa", "Maryland", "Virginia"
-        ]
+        return list(self._TRACKED_PROGRAMS)
     
     async def start(self):
         """Start the enriched orchestrator"""
@@ -116,15 +129,29 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
             except asyncio.CancelledError:
                 logger.info("News refresh task cancelled")
         
+        # Release the news agent's shared session, browser and worker pool
+        await self.news_agent.close()
+        
         # Stop the base orchestrator
         await super().stop()
     
     async def _schedule_news_refreshes(self):
-        """Background task to schedule periodic refreshes of news data"""
+        """Background task to schedule periodic refreshes of news data.
+
+        Ticks are scheduled against the loop clock so a slow refresh does
+        not push every later refresh back by its own duration, and failures
+        retry with exponential backoff instead of a flat minute.
+        Integration stays sequential after the refresh because it consumes
+        the items the refresh just produced.
+        """
+        loop = asyncio.get_running_loop()
+        interval = self.news_agent.config.refresh_interval
+        # Initial delay staggers the news refresh from the portal refresh
+        next_tick = loop.time() + 300
+        backoff = 5.0
         while True:
             try:
-                # Wait for initial delay (stagger the news refresh from portal refresh)
-                await asyncio.sleep(300)  # 5 minutes initial delay
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
                 
                 # Refresh news data
                 await self.news_agent.refresh_all_sources()
@@ -132,16 +159,22 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
                 # Integrate news data with portal data
                 await self._integrate_news_data()
                 
-                # Wait for next refresh
-                await asyncio.sleep(self.news_agent.config.refresh_interval)
+                # Deadline-based schedule; if the cycle overran the whole
+                # interval, start counting from now rather than piling up
+                # immediate back-to-back refreshes
+                next_tick += interval
+                if next_tick <= loop.time():
+                    next_tick = loop.time() + interval
+                backoff = 5.0
                 
             except asyncio.CancelledError:
                 logger.info("News refresh task cancelled")
                 break
             except Exception as e:
                 logger.error(f"Error in news refresh task: {str(e)}")
-                # Wait before retrying
-                await asyncio.sleep(60)
+                # Retry with exponential backoff, capped at five minutes
+                next_tick = loop.time() + backoff
+                backoff = min(backoff * 2, 300.0)
     
     async def _integrate_news_data(self):
         """
@@ -151,13 +184,16 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
         """
         logger.info("Integrating news data with transfer portal data")
         
-        # Get all players from the consolidated database
-        for player_id, player in list(self.players.items()):
-            # Get news items for this player
-            news_items = self.news_agent.query_news_items(
-                player_name=player.name,
-                limit=0
-            )
+        # Track whether anything changed so the derived read state is
+        # only rebuilt when enrichment actually landed an update
+        roster_changed = False
+        
+        # Get all players from the consolidated database. This loop only
+        # mutates player attributes, never the dict, so no snapshot copy
+        # of the roster is needed
+        for player in self.players.values():
+            # Get news items for this player from the agent's name index
+            news_items = self.news_agent.get_news_for_player(player.name)
             
             if not news_items:
                 continue
@@ -165,42 +201,45 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
             # Add any new transfer information
             for item in news_items:
                 # Update destination school if news reports a commitment
-                if (TransferEventType.COMMITMENT in item.event_types or 
-                    TransferEventType.PORTAL_ENTRY in item.event_types):
+                if item.event_mask & _COMMIT_OR_PORTAL_BITS:
                     # Only update if we have high confidence and player doesn't already have destination
                     if item.confidence_score >= 0.7 and not player.destination_school and item.destination_school:
                         player.destination_school = item.destination_school
+                        roster_changed = True
                         logger.info(f"Updated destination school for {player.name} to {item.destination_school} based on news")
                     
                     # Update previous school if not already known
                     if not player.previous_school and item.previous_school:
                         player.previous_school = item.previous_school
+                        roster_changed = True
                         logger.info(f"Updated previous school for {player.name} to {item.previous_school} based on news")
         
-        # Check for players in news that aren't in our database yet
-        all_news_items = list(self.news_agent.news_items.values())
+        # Check for players in news that aren't in our database yet,
+        # grouping the corpus by player name in one O(N) pass
+        news_by_player = defaultdict(list)
+        for item in self.news_agent.news_items.values():
+            news_by_player[item.player_name].append(item)
+        
+        # One pass over the roster builds the membership set; the old
+        # any() scan walked every player per news name
+        known_names = {p.name for p in self.players.values()}
         
-        # Group by player name
-        player_news = {}
-        for item in all_news_items:
-            if item.player_name not in player_news:
-                player_news[item.player_name] = []
-            player_news[item.player_name].append(item)
+        # Stage discoveries and merge once at the end instead of growing
+        # self.players mid-iteration
+        pending_new_players = {}
         
-        # Check each player
-        for player_name, items in player_news.items():
+        for player_name, items in news_by_player.items():
             # Skip if player is already in our database
-            player_exists = any(p.name == player_name for p in self.players.values())
-            if player_exists:
+            if player_name in known_names:
                 continue
             
             # Check if we have high-confidence news about this player entering the portal
-            portal_items = [item for item in items if TransferEventType.PORTAL_ENTRY in item.event_types]
+            portal_items = [item for item in items if item.event_mask & _PORTAL_BIT]
             if not portal_items:
                 continue
             
             # Sort by confidence score
-            portal_items.sort(key=lambda x: x.confidence_score, reverse=True)
+            portal_items.sort(key=operator.attrgetter('confidence_score'), reverse=True)
             
             # If we have high confidence, create a new player record
             if portal_items[0].confidence_score >= 0.8:
@@ -219,9 +258,19 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
                     status="in portal"
                 )
                 
-                # Add to database
-                self.players[player_id] = player
+                # Stage for the post-loop merge
+                pending_new_players[player_id] = player
                 logger.info(f"Added new player {player.name} based on news data")
+        
+        if pending_new_players:
+            self.players.update(pending_new_players)
+            roster_changed = True
+        
+        # News-derived updates bypass consolidation, so republish the
+        # indexes and cached serialization or they stay invisible to the
+        # read endpoints until a scrape happens to change
+        if roster_changed:
+            self._refresh_derived_state()
     
     def get_player_news(self, player_name: str, limit: int = 10) -> List[Dict]:
         """Get news items related to a specific player"""
@@ -251,12 +300,26 @@ class NewsEnrichedOrchestrator(TransferPortalOrchestrator):
     def query_news(self, **query_params) -> List[Dict]:
         """Query news items with the given parameters"""
         return self.news_adapter.query_news_items(query_params)
+    
+    def iter_news(self, **query_params):
+        """Yield news item dicts one at a time for streaming responses"""
+        return self.news_adapter.iter_news_items(query_params)
 
 
 # FastAPI endpoints for the news-enriched orchestrator
 def register_news_endpoints(app, enriched_orchestrator):
     """Register FastAPI endpoints for the news-enriched orchestrator"""
     from fastapi import APIRouter, Query, HTTPException
+    from fastapi.responses import JSONResponse, StreamingResponse
+    
+    # One app-level handler instead of a try/except wrapping every
+    # endpoint body; the handlers become plain returns with no exception
+    # machinery on the fast path. This also stops the blanket handlers
+    # from rewrapping deliberate HTTPExceptions (like the 400 below) as
+    # 500s.
+    @app.exception_handler(Exception)
+    async def _unhandled_error(request, exc):
+        return JSONResponse(status_code=500, content={"detail": str(exc)})
     
     # Create router
     news_router = APIRouter(prefix="/news", tags=["news"])
@@ -264,42 +327,27 @@ def register_news_endpoints(app, enriched_orchestrator):
     @news_router.get("/player/{player_name}")
     async def get_player_news(player_name: str, limit: int = Query(10, ge=1, le=100)):
         """Get news items for a specific player"""
-        try:
-            return enriched_orchestrator.get_player_news(player_name, limit)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        return enriched_orchestrator.get_player_news(player_name, limit)
     
     @news_router.get("/player/{player_name}/timeline")
     async def get_player_timeline(player_name: str):
         """Get chronological timeline for a player"""
-        try:
-            return enriched_orchestrator.get_player_timeline(player_name)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        return enriched_orchestrator.get_player_timeline(player_name)
     
     @news_router.get("/school/{school}")
     async def get_school_activity(school: str):
         """Get transfer activity for a school"""
-        try:
-            return enriched_orchestrator.get_school_news_activity(school)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        return enriched_orchestrator.get_school_news_activity(school)
     
     @news_router.get("/coaching-changes")
     async def get_coaching_changes():
         """Get detected coaching changes"""
-        try:
-            return enriched_orchestrator.detect_coaching_changes()
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        return enriched_orchestrator.detect_coaching_changes()
     
     @news_router.get("/trends")
     async def get_trends():
         """Get transfer portal trends from news"""
-        try:
-            return enriched_orchestrator.get_transfer_trends()
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        return enriched_orchestrator.get_transfer_trends()
     
     @news_router.get("/search")
     async def search_news(
@@ -312,32 +360,74 @@ def register_news_endpoints(app, enriched_orchestrator):
         limit: int = Query(20, ge=1, le=100)
     ):
         """Search news with the given parameters"""
-        try:
-            # Convert event_type string to enum if provided
-            event_type_enum = None
-            if event_type:
-                try:
-                    event_type_enum = TransferEventType(event_type)
-                except ValueError:
-                    raise HTTPException(status_code=400, detail=f"Invalid event type: {event_type}")
-            
-            # Build query params
-            params = {
-                "player_name": player_name,
-                "school": school,
-                "event_type": event_type_enum,
-                "min_confidence": min_confidence,
-                "verified_only": verified_only,
-                "days_back": days_back,
-                "limit": limit
-            }
-            
-            # Remove None values
-            params = {k: v for k, v in params.items() if v is not None}
-            
-            return enriched_orchestrator.query_news(**params)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        # Convert event_type string to enum if provided
+        event_type_enum = None
+        if event_type:
+            try:
+                event_type_enum = TransferEventType(event_type)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid event type: {event_type}")
+        
+        # Build query params
+        params = {
+            "player_name": player_name,
+            "school": school,
+            "event_type": event_type_enum,
+            "min_confidence": min_confidence,
+            "verified_only": verified_only,
+            "days_back": days_back,
+            "limit": limit
+        }
+        
+        # Remove None values
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        return enriched_orchestrator.query_news(**params)
+    
+    @news_router.get("/search/stream")
+    async def search_news_stream(
+        player_name: Optional[str] = None,
+        school: Optional[str] = None,
+        event_type: Optional[str] = None,
+        min_confidence: float = Query(0.0, ge=0.0, le=1.0),
+        verified_only: bool = False,
+        days_back: int = Query(7, ge=1, le=30),
+        limit: int = Query(20, ge=1, le=100)
+    ):
+        """Stream search results as NDJSON, one item per line.
+
+        Each item is encoded and sent as it is produced, so the full
+        serialized result set never sits in memory — use this for large
+        exports instead of /search.
+        """
+        import orjson
+        
+        # Validate event_type up front: once streaming starts the 200 is
+        # already on the wire, so a bad value must 400 here, not fail on
+        # the first pull of the generator
+        event_type_enum = None
+        if event_type:
+            try:
+                event_type_enum = TransferEventType(event_type)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid event type: {event_type}")
+        
+        params = {
+            "player_name": player_name,
+            "school": school,
+            "event_type": event_type_enum,
+            "min_confidence": min_confidence,
+            "verified_only": verified_only,
+            "days_back": days_back,
+            "limit": limit
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        def generate():
+            for item_dict in enriched_orchestrator.iter_news(**params):
+                yield orjson.dumps(item_dict) + b"\n"
+        
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
     
     # Add router to app
     app.include_router(news_router)
@@ -346,13 +436,18 @@ def register_news_endpoints(app, enriched_orchestrator):
 async def main():
     """Run the news-enriched orchestrator as a standalone service"""
     from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse
     import uvicorn
     
     # Create orchestrator
     orchestrator = NewsEnrichedOrchestrator()
     
-    # Create FastAPI app
-    app = FastAPI(title="Basketball Transfer Portal with News Integration")
+    # Create FastAPI app; orjson encodes the large news payloads in C
+    # instead of the default json module walking them a second time
+    app = FastAPI(
+        title="Basketball Transfer Portal with News Integration",
+        default_response_class=ORJSONResponse
+    )
     
     # Register news endpoints
     register_news_endpoints(app, orchestrator)
@@ -1,28 +1,53 @@
 import logging
-from typing import List, Dict, Any
-from src.agents.base_agent import BaseTransferPortalAgent
+import re
+from typing import List
+from src.agents.base_agent import BaseTransferPortalAgent, PlayerRecord
 from src.config.settings import RIVALS_TOP_PLAYERS_URL
 
 logger = logging.getLogger(__name__)
 
+# Status-cell parser: one anchored match replaces a substring scan plus a
+# replace() allocation per row
+_TRANSFERRED_RE = re.compile(r"^\s*TRANSFERRED TO\s*(.+?)\s*$", re.IGNORECASE)
+
+# Pull every row's cells out in one page.evaluate instead of paying a CDP
+# round-trip per query_selector/text_content call per row
+_EXTRACT_ROWS_JS = """() => {
+    const text = (row, sel) => {
+        const el = row.querySelector(sel);
+        return el ? el.textContent : 'N/A';
+    };
+    return Array.from(document.querySelectorAll('tr.transfer-tracker-row')).map(row => {
+        const link = row.querySelector("a[href*='content/athletes']");
+        return {
+            rank: text(row, 'td.rank'),
+            name: text(row, 'td.athlete'),
+            position: text(row, 'td.pos'),
+            origin: text(row, 'td.origin'),
+            status: text(row, 'td.status'),
+            profile_url: link ? link.getAttribute('href') : null
+        };
+    });
+}"""
+
 class RivalsTransferPortalAgent(BaseTransferPortalAgent):
     def __init__(self):
         super().__init__()
         self.url = RIVALS_TOP_PLAYERS_URL
 
-    async def scrape_players(self) -> List[Dict[str, Any]]:
+    async def scrape_players(self) -> List[PlayerRecord]:
         """Scrape player data from Rivals."""
         logger.info("Starting Rivals scraping...")
-        browser, page = await self._setup_browser()
+        context, page = await self._setup_browser()
         
         try:
-            logger.info(f"Navigating to {self.url}")
-            response = await page.goto(self.url, wait_until="networkidle", timeout=self.scraping_timeout * 1000)
+            logger.debug(f"Navigating to {self.url}")
+            response = await page.goto(self.url, wait_until="domcontentloaded", timeout=self.scraping_timeout * 1000)
             if not response.ok:
                 raise Exception(f"Failed to load Rivals page: {response.status} {response.status_text}")
             
             # Wait for the player table to load
-            logger.info("Waiting for Rivals player table to load...")
+            logger.debug("Waiting for Rivals player table to load...")
             try:
                 await page.wait_for_selector("table.transfer-tracker-table", timeout=self.selector_timeout)
             except Exception as e:
@@ -31,48 +56,33 @@ class RivalsTransferPortalAgent(BaseTransferPortalAgent):
             
             await self._take_debug_screenshot(page, "rivals")
             
-            # Extract player data
-            players = await page.query_selector_all("tr.transfer-tracker-row")
-            if not players:
+            # Extract every row in a single round-trip to the browser
+            rows = await page.evaluate(_EXTRACT_ROWS_JS)
+            if not rows:
                 raise Exception("No Rivals players found")
             
             player_data = []
-            for idx, player in enumerate(players, 1):
+            for idx, row in enumerate(rows, 1):
                 try:
-                    # Extract data using the Rivals structure
-                    rank = await player.query_selector("td.rank")
-                    name = await player.query_selector("td.athlete")
-                    position = await player.query_selector("td.pos")
-                    origin = await player.query_selector("td.origin")
-                    status = await player.query_selector("td.status")
-                    
-                    # Get text content safely
-                    rank_text = await rank.text_content() if rank else "N/A"
-                    name_text = await name.text_content() if name else "N/A"
-                    position_text = await position.text_content() if position else "N/A"
-                    origin_text = await origin.text_content() if origin else "N/A"
-                    status_text = await status.text_content() if status else "N/A"
+                    name_text = row["name"]
+                    status_text = row["status"]
                     
                     # Get player profile URL
-                    profile_url = None
-                    name_link = await player.query_selector("a[href*='content/athletes']")
-                    if name_link:
-                        profile_url = await name_link.get_attribute("href")
-                        if profile_url and not profile_url.startswith("http"):
-                            profile_url = f"https://n.rivals.com{profile_url}"
+                    profile_url = row["profile_url"]
+                    if profile_url and not profile_url.startswith("http"):
+                        profile_url = f"https://n.rivals.com{profile_url}"
                     
                     # Parse status to get last team and new team
-                    last_team = origin_text.strip()
-                    new_team = None
-                    if "TRANSFERRED TO" in status_text:
-                        new_team = status_text.replace("TRANSFERRED TO", "").strip()
+                    last_team = row["origin"].strip()
+                    status_match = _TRANSFERRED_RE.match(status_text)
+                    new_team = status_match.group(1) if status_match else None
                     
                     # Create player info dictionary
-                    player_info = {
+                    player_info: PlayerRecord = {
                         "source": "rivals",
-                        "rank": self._parse_rank(rank_text, name_text),
+                        "rank": self._parse_rank(row["rank"], name_text),
                         "name": name_text.strip(),
-                        "position": position_text.strip(),
+                        "position": row["position"].strip(),
                         "last_team": last_team,
                         "new_team": new_team,
                         "status": status_text.strip(),
@@ -88,4 +98,4 @@ class RivalsTransferPortalAgent(BaseTransferPortalAgent):
             return player_data
             
         finally:
-            await browser.close() 
\ No newline at end of file
+            await self._teardown_browser(context, page) 
\ No newline at end of file
@@ -35,7 +35,10 @@ async def main():
         
         # Print the first 3 players
         for i, player in enumerate(players[:3], 1):
-            logger.info(f"Player {i}: {json.dumps(player, indent=2)}")
+            # Pretty-printing every row is expensive; only pay for it
+            # when debug output is actually enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Player {i}: {json.dumps(player, indent=2)}")
         
     except Exception as e:
         logger.error(f"Error in orchestrator test: {str(e)}")
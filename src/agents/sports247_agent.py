@@ -1,28 +1,50 @@
 import logging
-from typing import List, Dict, Any
-from src.agents.base_agent import BaseTransferPortalAgent
+from typing import List
+from src.agents.base_agent import BaseTransferPortalAgent, PlayerRecord
 from src.config.settings import SPORTS247_TOP_PLAYERS_URL
 
 logger = logging.getLogger(__name__)
 
+# Pull every card's fields out in one page.evaluate instead of paying a CDP
+# round-trip per query_selector/text_content call per card
+_EXTRACT_CARDS_JS = """() => {
+    const text = (card, sel) => {
+        const el = card.querySelector(sel);
+        return el ? el.textContent : 'N/A';
+    };
+    return Array.from(document.querySelectorAll('div.player-card')).map(card => {
+        const link = card.querySelector('a.player-link');
+        return {
+            rank: text(card, 'div.rank'),
+            name: text(card, 'div.player-name'),
+            position: text(card, 'div.position'),
+            rating: text(card, 'div.rating'),
+            status: text(card, 'div.status'),
+            last_team: text(card, 'div.last-team'),
+            new_team: text(card, 'div.new-team'),
+            profile_url: link ? link.getAttribute('href') : null
+        };
+    });
+}"""
+
 class Sports247TransferPortalAgent(BaseTransferPortalAgent):
     def __init__(self):
         super().__init__()
         self.url = SPORTS247_TOP_PLAYERS_URL
 
-    async def scrape_players(self) -> List[Dict[str, Any]]:
+    async def scrape_players(self) -> List[PlayerRecord]:
         """Scrape player data from 247Sports."""
         logger.info("Starting 247Sports scraping...")
-        browser, page = await self._setup_browser()
+        context, page = await self._setup_browser()
         
         try:
-            logger.info(f"Navigating to {self.url}")
-            response = await page.goto(self.url, wait_until="networkidle", timeout=self.scraping_timeout * 1000)
+            logger.debug(f"Navigating to {self.url}")
+            response = await page.goto(self.url, wait_until="domcontentloaded", timeout=self.scraping_timeout * 1000)
             if not response.ok:
                 raise Exception(f"Failed to load 247Sports page: {response.status} {response.status_text}")
             
             # Wait for the player list to load
-            logger.info("Waiting for 247Sports player list to load...")
+            logger.debug("Waiting for 247Sports player list to load...")
             try:
                 await page.wait_for_selector("div.player-card", timeout=self.selector_timeout)
             except Exception as e:
@@ -31,50 +53,31 @@ class Sports247TransferPortalAgent(BaseTransferPortalAgent):
             
             await self._take_debug_screenshot(page, "247")
             
-            # Extract player data
-            players = await page.query_selector_all("div.player-card")
-            if not players:
+            # Extract every card in a single round-trip to the browser
+            cards = await page.evaluate(_EXTRACT_CARDS_JS)
+            if not cards:
                 raise Exception("No 247Sports players found")
             
             player_data = []
-            for idx, player in enumerate(players, 1):
+            for idx, card in enumerate(cards, 1):
                 try:
-                    # Extract data using the 247Sports structure
-                    rank = await player.query_selector("div.rank")
-                    name = await player.query_selector("div.player-name")
-                    position = await player.query_selector("div.position")
-                    rating = await player.query_selector("div.rating")
-                    status = await player.query_selector("div.status")
-                    last_team = await player.query_selector("div.last-team")
-                    new_team = await player.query_selector("div.new-team")
-                    
-                    # Get text content safely
-                    rank_text = await rank.text_content() if rank else "N/A"
-                    name_text = await name.text_content() if name else "N/A"
-                    position_text = await position.text_content() if position else "N/A"
-                    rating_text = await rating.text_content() if rating else "N/A"
-                    status_text = await status.text_content() if status else "N/A"
-                    last_team_text = await last_team.text_content() if last_team else "N/A"
-                    new_team_text = await new_team.text_content() if new_team else "N/A"
+                    name_text = card["name"]
                     
                     # Get player profile URL
-                    profile_url = None
-                    name_link = await player.query_selector("a.player-link")
-                    if name_link:
-                        profile_url = await name_link.get_attribute("href")
-                        if profile_url and not profile_url.startswith("http"):
-                            profile_url = f"https://247sports.com{profile_url}"
+                    profile_url = card["profile_url"]
+                    if profile_url and not profile_url.startswith("http"):
+                        profile_url = f"https://247sports.com{profile_url}"
                     
                     # Create player info dictionary
-                    player_info = {
+                    player_info: PlayerRecord = {
                         "source": "247sports",
-                        "rank": self._parse_rank(rank_text, name_text),
+                        "rank": self._parse_rank(card["rank"], name_text),
                         "name": name_text.strip(),
-                        "position": position_text.strip(),
-                        "rating": self._parse_numeric_value(rating_text, "rating", name_text),
-                        "status": status_text.strip(),
-                        "last_team": last_team_text.strip(),
-                        "new_team": new_team_text.strip(),
+                        "position": card["position"].strip(),
+                        "rating": self._parse_numeric_value(card["rating"], "rating", name_text),
+                        "status": card["status"].strip(),
+                        "last_team": card["last_team"].strip(),
+                        "new_team": card["new_team"].strip(),
                         "profile_url": profile_url
                     }
                     
@@ -87,4 +90,4 @@ class Sports247TransferPortalAgent(BaseTransferPortalAgent):
             return player_data
             
         finally:
-            await browser.close() 
\ No newline at end of file
+            await self._teardown_browser(context, page) 
\ No newline at end of file
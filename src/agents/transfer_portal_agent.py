@@ -1,11 +1,19 @@
 import asyncio
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
+import re
 import time
+import orjson
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from src.config.settings import (
     CACHE_EXPIRY,
@@ -15,6 +23,7 @@ from src.config.settings import (
     USE_ON3,
     USE_RIVALS
 )
+from src.agents.base_agent import BROWSER_POOL_SIZE
 from src.agents.on3_agent import On3TransferPortalAgent
 from src.agents.sports247_agent import Sports247TransferPortalAgent
 from src.agents.rivals_agent import RivalsTransferPortalAgent
@@ -27,14 +36,74 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="Basketball Transfer Portal Agent")
+app = FastAPI(title="Basketball Transfer Portal Agent", default_response_class=ORJSONResponse)
 
-# Cache for storing player data
-player_cache = {
-    "data": [],
-    "last_updated": 0
+# One C-level sweep over the stats line; each match is (value, tag)
+_STAT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%?\s*(PPG|RPG|APG|SPG|BPG|FG|3PT|FT)")
+_STAT_KEYS = {
+    "PPG": "ppg",
+    "RPG": "rpg",
+    "APG": "apg",
+    "SPG": "spg",
+    "BPG": "bpg",
+    "FG": "fg_pct",
+    "3PT": "three_pt_pct",
+    "FT": "ft_pct"
 }
 
+@dataclass(slots=True)
+class PlayerCache:
+    """Cached portal data plus its read-side derivatives.
+
+    `version` increments on every refresh, giving handlers a cheap weak
+    validator for ETag/304 handling without hashing the payload.
+    """
+    data: List[Dict[str, Any]] = field(default_factory=list)
+    models: List["Player"] = field(default_factory=list)
+    dump: List[Dict[str, Any]] = field(default_factory=list)
+    idx: Dict[str, Dict[str, set]] = field(default_factory=dict)
+    ppg: List[float] = field(default_factory=list)
+    body: bytes = b"[]"
+    etag: str = ""
+    last_updated: float = 0
+    version: int = 0
+
+
+# Cache for storing player data
+player_cache = PlayerCache()
+
+
+def _build_indexes(players: List[Dict[str, Any]]) -> Dict[str, Dict[str, set]]:
+    """Build inverted indexes (lowercase value -> row indices) for search."""
+    position_idx = defaultdict(set)
+    school_idx = defaultdict(set)
+    status_idx = defaultdict(set)
+    
+    for i, player in enumerate(players):
+        position_idx[player.get("position", "").lower()].add(i)
+        school_idx[player.get("previous_school", "").lower()].add(i)
+        if player.get("destination_school"):
+            school_idx[player["destination_school"].lower()].add(i)
+        status_idx[player.get("status", "").lower()].add(i)
+    
+    return {
+        "position": dict(position_idx),
+        "school": dict(school_idx),
+        "status": dict(status_idx)
+    }
+
+
+def _index_lookup(index: Dict[str, set], query_l: str) -> set:
+    """Row indices whose indexed value contains query_l."""
+    # Scan the few distinct keys, never the rows themselves. No exact-key
+    # shortcut: the substring semantics mean "michigan" matches the
+    # "michigan state" bucket too
+    matched = set()
+    for key, rows in index.items():
+        if query_l in key:
+            matched |= rows
+    return matched
+
 class PlayerStats(BaseModel):
     ppg: Optional[float] = None
     rpg: Optional[float] = None
@@ -60,49 +129,151 @@ class Player(BaseModel):
     profile_url: Optional[str] = None
     nil_valuation: Optional[float] = None
 
+
+def _normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a scraped PlayerRecord onto the Player schema.
+
+    The scrapers emit last_team/new_team and N/A placeholders; the model
+    wants previous_school/destination_school and real optionals, so the
+    mapping happens once here before refresh-time validation.
+    """
+    player = {
+        "name": row.get("name", ""),
+        "position": row.get("position", ""),
+        "previous_school": row.get("previous_school") or row.get("last_team") or "",
+        "status": row.get("status", ""),
+        "profile_url": row.get("profile_url")
+    }
+    destination = row.get("destination_school") or row.get("new_team")
+    if destination and destination != "N/A":
+        player["destination_school"] = destination
+    if row.get("stats"):
+        player["stats"] = row["stats"]
+    rank = row.get("rank")
+    if rank:
+        player["ranking"] = float(rank)
+    nil_value = row.get("nil_value")
+    if nil_value:
+        player["nil_valuation"] = float(nil_value)
+    return player
+
+
 class BasketballTransferPortalAgent:
     def __init__(self):
         self.cache_expiry = CACHE_EXPIRY
         self.on3_agent = On3TransferPortalAgent()
         self.sports247_agent = Sports247TransferPortalAgent()
         self.rivals_agent = RivalsTransferPortalAgent()
+        # Bound concurrent browser-using scrapes to the pool size so the
+        # gather fan-out cannot exhaust the pooled contexts
+        self._scrape_semaphore = asyncio.Semaphore(BROWSER_POOL_SIZE)
+        # Single-writer guard so the first request after TTL expiry does
+        # one refresh and concurrent callers reuse its result
+        self._refresh_lock = asyncio.Lock()
+        # In-flight background revalidation, if any
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _scrape_source(self, agent):
+        async with self._scrape_semaphore:
+            return await agent.scrape_players()
+
+    async def ensure_fresh_data(self):
+        """Serve-stale-while-revalidate entry point for the read paths.
+
+        With a populated cache, a lapsed TTL only schedules a background
+        refresh and the caller reads the stale data immediately; requests
+        block on scraping only when the cache is empty (cold start or
+        never-succeeded refresh).
+        """
+        if player_cache.data:
+            self._maybe_kick_refresh()
+            return
+        await self.refresh_data()
+
+    def _maybe_kick_refresh(self):
+        """Spawn a background refresh if stale and none is in flight."""
+        if time.time() - player_cache.last_updated < self.cache_expiry:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self):
+        try:
+            await self.refresh_data()
+        except Exception as e:
+            # Keep serving stale data; the next stale read retries
+            logger.error(f"Background refresh failed: {str(e)}")
 
     async def refresh_data(self):
         """Refresh the player data from the transfer portal."""
-        current_time = time.time()
-        if current_time - player_cache["last_updated"] < self.cache_expiry:
-            logger.info("Using cached data")
-            return player_cache["data"]
-
-        all_players = []
+        # Lock-free fast path for the common warm-cache case
+        if time.time() - player_cache.last_updated < self.cache_expiry:
+            logger.debug("Using cached data")
+            return player_cache.data
         
+        async with self._refresh_lock:
+            # Re-check under the lock: every coroutine that queued behind
+            # the winning refresh finds a fresh cache here and returns
+            # without firing its own scrapes
+            current_time = time.time()
+            if current_time - player_cache.last_updated < self.cache_expiry:
+                return player_cache.data
+            return await self._do_refresh(current_time)
+
+    async def _do_refresh(self, current_time: float):
+        """Scrape all sources and rebuild the cache (caller holds the lock)."""
+        # Scrape the enabled sources concurrently; each scrape is
+        # network-bound, so the refresh costs max(t_source) instead of
+        # the sum of the three
+        tasks = []
+        sources = []
         if USE_ON3:
-            try:
-                on3_players = await self.on3_agent.scrape_players()
-                all_players.extend(on3_players)
-            except Exception as e:
-                logger.error(f"Error scraping On3: {str(e)}")
-        
+            tasks.append(self._scrape_source(self.on3_agent))
+            sources.append("On3")
         if USE_247SPORTS:
-            try:
-                sports247_players = await self.sports247_agent.scrape_players()
-                all_players.extend(sports247_players)
-            except Exception as e:
-                logger.error(f"Error scraping 247Sports: {str(e)}")
-        
+            tasks.append(self._scrape_source(self.sports247_agent))
+            sources.append("247Sports")
         if USE_RIVALS:
-            try:
-                rivals_players = await self.rivals_agent.scrape_players()
-                all_players.extend(rivals_players)
-            except Exception as e:
-                logger.error(f"Error scraping Rivals: {str(e)}")
+            tasks.append(self._scrape_source(self.rivals_agent))
+            sources.append("Rivals")
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Keep the per-source lists and merge them in one pass at the
+        # cache-write boundary; the read paths address rows by index, so
+        # this is the single point where a materialized list is needed
+        source_lists = []
+        for source, result in zip(sources, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping {source}: {str(result)}")
+            else:
+                source_lists.append(result)
+        all_players = [
+            _normalize_row(row)
+            for row in itertools.chain.from_iterable(source_lists)
+        ]
         
         if not all_players:
             raise HTTPException(status_code=500, detail="Failed to refresh transfer portal data from any source")
         
-        # Update cache
-        player_cache["data"] = all_players
-        player_cache["last_updated"] = current_time
+        # Update cache; the indexes are rebuilt once per refresh so
+        # searches intersect row-id sets instead of scanning every player,
+        # and validation runs once here instead of on every read
+        player_cache.data = all_players
+        player_cache.models = [Player(**player) for player in all_players]
+        player_cache.dump = [model.dict() for model in player_cache.models]
+        player_cache.idx = _build_indexes(all_players)
+        # Flat numeric column for the min_ppg filter: one list index and
+        # float compare per row instead of two dict lookups
+        player_cache.ppg = [
+            (p.get("stats") or {}).get("ppg") or 0.0 for p in all_players
+        ]
+        # Pre-encode the /players body once per refresh; serving a
+        # request then costs a header compare and a memcpy
+        player_cache.body = orjson.dumps(player_cache.dump)
+        player_cache.etag = f'W/"{hashlib.blake2b(player_cache.body, digest_size=8).hexdigest()}"'
+        player_cache.last_updated = current_time
+        player_cache.version += 1
         
         logger.info(f"Successfully refreshed data for {len(all_players)} players")
         return all_players
@@ -110,35 +281,19 @@ class BasketballTransferPortalAgent:
     def _parse_stats(self, stats_text: str) -> Optional[Dict[str, float]]:
         """Parse player statistics from text."""
         try:
-            stats = {}
-            parts = stats_text.split("|")
-            for part in parts:
-                part = part.strip()
-                if "PPG" in part:
-                    stats["ppg"] = float(part.replace("PPG", "").strip())
-                elif "RPG" in part:
-                    stats["rpg"] = float(part.replace("RPG", "").strip())
-                elif "APG" in part:
-                    stats["apg"] = float(part.replace("APG", "").strip())
-                elif "SPG" in part:
-                    stats["spg"] = float(part.replace("SPG", "").strip())
-                elif "BPG" in part:
-                    stats["bpg"] = float(part.replace("BPG", "").strip())
-                elif "FG" in part:
-                    stats["fg_pct"] = float(part.replace("% FG", "").strip())
-                elif "3PT" in part:
-                    stats["three_pt_pct"] = float(part.replace("% 3PT", "").strip())
-                elif "FT" in part:
-                    stats["ft_pct"] = float(part.replace("% FT", "").strip())
+            stats = {
+                _STAT_KEYS[tag]: float(value)
+                for value, tag in _STAT_RE.findall(stats_text)
+            }
             return stats if stats else None
         except Exception as e:
             logger.error(f"Error parsing stats: {str(e)}")
             return None
 
-    async def get_players(self) -> List[Player]:
+    async def get_players(self) -> List[Dict[str, Any]]:
         """Get all transfer portal players."""
-        data = await self.refresh_data()
-        return [Player(**player) for player in data]
+        await self.ensure_fresh_data()
+        return player_cache.dump
 
     async def search_players(
         self,
@@ -148,47 +303,84 @@ class BasketballTransferPortalAgent:
         status: Optional[str] = None,
         limit: Optional[int] = 20,
         **kwargs
-    ) -> List[Player]:
+    ) -> List[Dict[str, Any]]:
         """Search players by various criteria."""
-        data = await self.refresh_data()
-        filtered_players = data
+        await self.ensure_fresh_data()
         
-        if position:
-            filtered_players = [p for p in filtered_players if position.lower() in p["position"].lower()]
-        if min_ppg is not None:
-            filtered_players = [
-                p for p in filtered_players 
-                if p.get("stats", {}).get("ppg", 0) >= min_ppg
-            ]
-        if school:
-            filtered_players = [
-                p for p in filtered_players 
-                if school.lower() in p["previous_school"].lower() or
-                   (p.get("destination_school") and school.lower() in p["destination_school"].lower())
-            ]
-        if status:
-            filtered_players = [
-                p for p in filtered_players 
-                if status.lower() in p["status"].lower()
-            ]
+        # Normalize the filters once; the memoized resolver below maps
+        # the (version, filters) signature to row indices
+        position_l = position.lower() if position else None
+        school_l = school.lower() if school else None
+        status_l = status.lower() if status else None
         
-        if limit:
-            filtered_players = filtered_players[:limit]
-            
-        return [Player(**player) for player in filtered_players]
+        selected = _search_rows(
+            player_cache.version, position_l, min_ppg, school_l, status_l, limit
+        )
+        
+        # Index into the rows validated and serialized at refresh time
+        dump = player_cache.dump
+        return [dump[i] for i in selected]
+
+@functools.lru_cache(maxsize=512)
+def _search_rows(
+    version: int,
+    position_l: Optional[str],
+    min_ppg: Optional[float],
+    school_l: Optional[str],
+    status_l: Optional[str],
+    limit: Optional[int]
+) -> tuple:
+    """Resolve a search to a tuple of cache row indices.
+
+    Memoized on the full filter signature plus the cache version, so
+    repeated identical searches (UI dropdowns, dashboard polls) return
+    in O(1) and every entry is invalidated naturally when a refresh
+    bumps the version.
+    """
+    data = player_cache.data
+    idx = player_cache.idx
+    
+    # Intersect candidate row sets from the inverted indexes; the scan
+    # below then only touches the smallest surviving candidate set
+    candidates = None
+    if position_l is not None:
+        candidates = _index_lookup(idx["position"], position_l)
+    if school_l is not None:
+        school_rows = _index_lookup(idx["school"], school_l)
+        candidates = school_rows if candidates is None else candidates & school_rows
+    if status_l is not None:
+        status_rows = _index_lookup(idx["status"], status_l)
+        candidates = status_rows if candidates is None else candidates & status_rows
+    
+    ppg = player_cache.ppg
+    indices = range(len(data)) if candidates is None else sorted(candidates)
+    matches = (
+        i for i in indices
+        if min_ppg is None or ppg[i] >= min_ppg
+    )
+    return tuple(itertools.islice(matches, limit) if limit else matches)
+
 
 # Initialize the agent
 agent = BasketballTransferPortalAgent()
 
 # API endpoints
-@app.get("/players", response_model=List[Player])
-async def get_players():
+@app.get("/players")
+async def get_players(request: Request):
     """Get all transfer portal players."""
-    logger.info("Received request for all players")
+    logger.debug("Received request for all players")
     try:
-        players = await agent.get_players()
-        logger.info(f"Successfully retrieved {len(players)} players")
-        return players
+        await agent.ensure_fresh_data()
+        # The payload only changes when a refresh lands; revalidating
+        # clients get a 0-byte 304, everyone else the pre-encoded bytes
+        if request.headers.get("if-none-match") == player_cache.etag:
+            return Response(status_code=304)
+        logger.debug("Successfully retrieved %d players", len(player_cache.dump))
+        return Response(
+            content=player_cache.body,
+            media_type="application/json",
+            headers={"ETag": player_cache.etag}
+        )
     except Exception as e:
         logger.error(f"Error getting players: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -205,7 +397,7 @@ async def refresh_data():
         logger.error(f"Error refreshing data: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/players/search", response_model=List[Player])
+@app.get("/players/search")
 async def search_players(
     position: Optional[str] = None,
     min_ppg: Optional[float] = None,
@@ -214,7 +406,10 @@ async def search_players(
     limit: Optional[int] = 20
 ):
     """Search players by various criteria."""
-    logger.info(f"Received search request with filters: position={position}, min_ppg={min_ppg}, school={school}, status={status}, limit={limit}")
+    logger.debug(
+        "Received search request: position=%s min_ppg=%s school=%s status=%s limit=%s",
+        position, min_ppg, school, status, limit
+    )
     try:
         players = await agent.search_players(
             position=position,
@@ -223,7 +418,7 @@ async def search_players(
             status=status,
             limit=limit
         )
-        logger.info(f"Successfully found {len(players)} players matching criteria")
+        logger.debug("Successfully found %d players matching criteria", len(players))
         return players
     except Exception as e:
         logger.error(f"Error searching players: {str(e)}")
@@ -233,7 +428,14 @@ if __name__ == "__main__":
     import uvicorn
     logger.info("Starting Basketball Transfer Portal Agent on port 3000...")
     try:
-        uvicorn.run(app, host="127.0.0.1", port=3000, log_level="debug")
+        uvicorn.run(
+            app,
+            host="127.0.0.1",
+            port=3000,
+            log_level="info",
+            loop="uvloop",
+            http="httptools"
+        )
     except Exception as e:
         logger.error(f"Failed to start server: {str(e)}")
         raise 
\ No newline at end of file
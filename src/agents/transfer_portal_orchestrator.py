@@ -12,16 +12,24 @@ Key responsibilities:
 """
 
 import asyncio
+import functools
+import heapq
 import logging
+import string
 import time
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Union, Any
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, PrivateAttr
 
 # Import site-specific agents
+from src.agents.base_agent import BrowserPool, shutdown_playwright
 from src.agents.on3_agent import On3TransferPortalAgent
 from src.agents.rivals_agent import RivalsTransferPortalAgent
 from src.agents.sports247_agent import Sports247TransferPortalAgent
@@ -33,8 +41,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Strips punctuation and whitespace in one C-level pass when building
+# canonical player ids
+_ID_STRIP_TABLE = str.maketrans("", "", string.punctuation + string.whitespace)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _canonical_id_token(value: str) -> str:
+    """Reduce a name or school to a canonical ascii id token.
+
+    NFKD-decomposing and dropping the non-ascii remainder folds accents
+    and punctuation variants ("D'Angelo" vs "DAngelo") onto one token, so
+    sources that disagree on formatting merge into a single record. The
+    cache is effective because the same (name, school) strings recur on
+    every consolidation.
+    """
+    ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
+    return ascii_value.lower().translate(_ID_STRIP_TABLE)
+
+
 # Initialize FastAPI app
-app = FastAPI(title="Basketball Transfer Portal Orchestrator")
+app = FastAPI(title="Basketball Transfer Portal Orchestrator", default_response_class=ORJSONResponse)
 
 
 class DataSource(str, Enum):
@@ -88,6 +115,11 @@ class TransferPlayer(BaseModel):
     sources: List[DataSource] = Field(default_factory=list)
     last_updated: Dict[DataSource, str] = Field(default_factory=dict)
     
+    # Running ranking aggregates so composite_ranking updates are O(1)
+    # per source instead of re-walking the rankings dict every update
+    _rank_sum: int = PrivateAttr(default=0)
+    _rank_count: int = PrivateAttr(default=0)
+    
     @property
     def best_stats(self) -> Optional[PlayerStats]:
         """Return the best available stats based on source priority"""
@@ -145,18 +177,55 @@ class TransferPortalOrchestrator:
             source: AgentMetrics() for source in self.agents.keys()
         }
         
+        # Source ordinal lookup so the scheduler's stagger calculation
+        # does not rebuild and scan the agent key list on every tick
+        self._source_index = {s: i for i, s in enumerate(self.agents.keys())}
+        
+        # Monotonic timestamps of the last successful refresh per source;
+        # the scheduler does time math on these instead of round-tripping
+        # the iso strings kept in metrics for reporting
+        self._last_refresh_monotonic: Dict[DataSource, float] = {}
+        
         # Consolidated player data
         self.players: Dict[str, TransferPlayer] = {}
         self.last_consolidation: Optional[float] = None
         
+        # Secondary indexes over self.players, rebuilt after each
+        # consolidation so queries intersect id sets instead of scanning
+        # and re-filtering the full player list per request
+        self._by_position: Dict[str, set] = {}
+        self._by_school: Dict[str, set] = {}
+        self._by_status: Dict[str, set] = {}
+        self._ranked: List[tuple] = []
+        # Serialized player list, rebuilt once per consolidation so the
+        # read endpoints never re-walk the pydantic models per request
+        self._players_serialized: List[Dict[str, Any]] = []
+        
+        # Incremental-consolidation bookkeeping: a version per agent cache
+        # (bumped when a refresh actually changes the data), the version
+        # each source was last merged at, and the player ids each source
+        # currently contributes
+        self._cache_versions: Dict[DataSource, int] = {}
+        self._last_seen_version: Dict[DataSource, int] = {}
+        self._source_ids: Dict[DataSource, set] = {}
+        
         # Background tasks
         self.refresh_tasks = {}
+        
+        # Serializes consolidations; the merge runs in a worker thread,
+        # so without this two overlapping refreshes could interleave
+        self._consolidation_lock = asyncio.Lock()
     
     async def start(self):
         """Start the orchestrator background tasks"""
         logger.info("Starting Transfer Portal Orchestrator")
         
         try:
+            # Pre-launch the shared browser pool so the concurrent agent
+            # refreshes below reuse warm contexts instead of each paying
+            # Chromium launch cost on first use
+            await BrowserPool.get().start()
+
             # Initialize data
             logger.info("Initializing data from all agents...")
             # Make the initial refresh optional to avoid startup issues
@@ -172,7 +241,7 @@ class TransferPortalOrchestrator:
                 self.refresh_tasks[source] = asyncio.create_task(
                     self._schedule_refreshes(source)
                 )
-                logger.info(f"Started refresh task for {source}")
+                logger.debug(f"Started refresh task for {source}")
             
             logger.info("Orchestrator startup complete")
         except Exception as e:
@@ -189,22 +258,23 @@ class TransferPortalOrchestrator:
         
         # Await task cancellation
         await asyncio.gather(*self.refresh_tasks.values(), return_exceptions=True)
+
+        # Release the shared browser pool and Playwright driver
+        await BrowserPool.get().stop()
+        await shutdown_playwright()
     
     async def _schedule_refreshes(self, source: DataSource):
         """Background task to schedule periodic refreshes for a source"""
         while True:
             try:
                 # Calculate time to next refresh
-                metrics = self.metrics[source]
-                if metrics.last_successful_refresh:
-                    last_refresh_time = datetime.fromisoformat(metrics.last_successful_refresh)
-                    now = datetime.now()
-                    elapsed = (now - last_refresh_time).total_seconds()
+                last_refresh = self._last_refresh_monotonic.get(source)
+                if last_refresh is not None:
+                    elapsed = time.monotonic() - last_refresh
                     wait_time = max(0, self.refresh_interval - elapsed)
                 else:
                     # If never refreshed, wait a short time (stagger initial refreshes)
-                    source_index = list(self.agents.keys()).index(source)
-                    wait_time = source_index * 10  # Stagger by 10 seconds per source
+                    wait_time = self._source_index[source] * 10  # Stagger by 10 seconds per source
                 
                 # Wait until next refresh
                 await asyncio.sleep(wait_time)
@@ -220,8 +290,12 @@ class TransferPortalOrchestrator:
                 # Wait before retrying
                 await asyncio.sleep(60)
     
-    async def refresh_agent(self, source: DataSource) -> bool:
-        """Refresh data from a specific agent"""
+    async def refresh_agent(self, source: DataSource, consolidate: bool = True) -> bool:
+        """Refresh data from a specific agent.
+        
+        `consolidate` lets refresh_all_agents defer consolidation until
+        every source has refreshed, rather than re-merging per agent.
+        """
         agent = self.agents[source]
         metrics = self.metrics[source]
         
@@ -250,14 +324,20 @@ class TransferPortalOrchestrator:
             
             metrics.refresh_count += 1
             metrics.last_successful_refresh = datetime.now().isoformat()
+            self._last_refresh_monotonic[source] = time.monotonic()
             metrics.player_count = len(data) if data else 0
             metrics.status = AgentStatus.READY
             
-            # Save agent data
+            # Save agent data, bumping the cache version only when the
+            # scrape actually changed it so consolidation can skip the
+            # source otherwise
+            if data != agent.data_cache:
+                self._cache_versions[source] = self._cache_versions.get(source, 0) + 1
             agent.data_cache = data
             
             # Consolidate data
-            await self.consolidate_data()
+            if consolidate:
+                await self.consolidate_data()
             
             return True
             
@@ -271,88 +351,194 @@ class TransferPortalOrchestrator:
     async def refresh_all_agents(self):
         """Refresh data from all agents"""
         refresh_tasks = [
-            self.refresh_agent(source)
+            self.refresh_agent(source, consolidate=False)
             for source in self.agents.keys()
         ]
         
         results = await asyncio.gather(*refresh_tasks, return_exceptions=True)
         
         # Check if at least one agent succeeded
-        return any(isinstance(result, bool) and result for result in results)
-    
-    async def consolidate_data(self):
-        """Consolidate data from all agents"""
-        logger.info("Consolidating data from all sources")
+        success = any(isinstance(result, bool) and result for result in results)
         
-        # Track existing players for cleanup
-        existing_players = set(self.players.keys())
-        processed_players = set()
+        # Consolidate once over all refreshed caches instead of once per
+        # agent; the per-agent runs were back-to-back full merges whose
+        # results were discarded by the last one
+        if success:
+            await self.consolidate_data()
         
-        # Process each source
+        return success
+    
+    async def consolidate_data(self):
+        """Consolidate data from all agents.
+        
+        The merge is pure dict/list work that can take hundreds of
+        milliseconds with thousands of players, and it never awaits, so
+        running it inline would stall every request handler on the event
+        loop. It runs in a worker thread instead; agent caches are
+        rebound (never mutated) by refresh_agent, so the thread reads a
+        stable list per source.
+        """
+        async with self._consolidation_lock:
+            await asyncio.to_thread(self._consolidate_sync)
+    
+    def _consolidate_sync(self):
+        """Synchronous consolidation body (runs off the event loop).
+        
+        The merge is built into a fresh dict — players it touches are
+        copy-on-write copies — and published via attribute rebinds at
+        the end, so event-loop readers of self.players and the derived
+        structures never observe a half-merged roster.
+        """
+        logger.debug("Consolidating data from all sources")
+        
+        # One timestamp per consolidation; formatting datetime.now() per
+        # player per source is pure overhead at this granularity
+        now_iso = datetime.now().isoformat()
+        
+        changed = False
+        new_players = dict(self.players)
+        copied = set()
+        
+        # Process each source, merging only caches that changed since the
+        # last consolidation; most cycles touch a fraction of the data
         for source, agent in self.agents.items():
             metrics = self.metrics[source]
             
-            # Skip inactive or error agents
-            if metrics.status not in [AgentStatus.READY, AgentStatus.RUNNING]:
+            # Inactive or empty agents contribute no players this cycle
+            if metrics.status not in [AgentStatus.READY, AgentStatus.RUNNING] or not agent.data_cache:
+                if self._source_ids.get(source):
+                    self._source_ids[source] = set()
+                    self._last_seen_version.pop(source, None)
+                    changed = True
+                continue
+            
+            # Unchanged cache: its players are already merged
+            version = self._cache_versions.get(source, 0)
+            if self._last_seen_version.get(source) == version:
                 continue
             
             # Get data from agent cache
             try:
-                data = agent.data_cache
-                if not data:
-                    continue
-                
-                for player_data in data:
+                source_ids = set()
+                for player_data in agent.data_cache:
                     # Generate a consistent player ID
                     player_id = self._generate_player_id(player_data["name"], player_data.get("previous_school"))
-                    processed_players.add(player_id)
+                    source_ids.add(player_id)
                     
                     # Create or update player record
-                    if player_id not in self.players:
+                    if player_id not in new_players:
                         # Create new consolidated player record
                         player = TransferPlayer(
                             player_id=player_id,
                             name=player_data["name"],
                             sources=[source]
                         )
-                        self.players[player_id] = player
+                        new_players[player_id] = player
+                        copied.add(player_id)
                     else:
-                        # Update existing player
-                        player = self.players[player_id]
+                        # Update existing player, copy-on-write: never
+                        # mutate an instance the event loop may be reading
+                        player = new_players[player_id]
+                        if player_id not in copied:
+                            player = player.copy(deep=True)
+                            new_players[player_id] = player
+                            copied.add(player_id)
                         if source not in player.sources:
                             player.sources.append(source)
                     
                     # Update player details with data from this source
-                    self._update_player_from_source(player, player_data, source)
+                    self._update_player_from_source(player, player_data, source, now_iso)
+                
+                self._source_ids[source] = source_ids
+                self._last_seen_version[source] = version
+                changed = True
             
             except Exception as e:
                 logger.error(f"Error consolidating data from {source}: {str(e)}")
         
+        if not changed:
+            self.last_consolidation = time.time()
+            logger.debug("Data consolidation skipped; no source caches changed.")
+            return
+        
         # Remove players that no longer exist in any source
-        for player_id in existing_players - processed_players:
-            self.players.pop(player_id, None)
+        live_ids = set().union(*self._source_ids.values()) if self._source_ids else set()
+        for player_id in set(new_players.keys()) - live_ids:
+            new_players.pop(player_id, None)
+        
+        # Publish the merged roster, then its derived read structures;
+        # each rebind is a single atomic store for event-loop readers
+        self.players = new_players
+        self._refresh_derived_state()
         
         # Update consolidation timestamp
         self.last_consolidation = time.time()
         
-        logger.info(f"Data consolidation complete. {len(self.players)} players in consolidated database.")
+        logger.debug(f"Data consolidation complete. {len(self.players)} players in consolidated database.")
+    
+    def _refresh_derived_state(self):
+        """Rebuild the query indexes and cached serialization from self.players.
+        
+        Consolidation calls this after publishing a merge. Anything else
+        that mutates the roster outside consolidation — news enrichment,
+        for example — must call it too, or its updates never reach
+        /portal/players and the query indexes (consolidation may skip
+        rebuilds entirely while the scraped caches are unchanged).
+        """
+        self._rebuild_indexes()
+        self._players_serialized = [p.dict() for p in self.players.values()]
+    
+    def _rebuild_indexes(self):
+        """Rebuild the secondary query indexes from self.players"""
+        by_position = defaultdict(set)
+        by_school = defaultdict(set)
+        by_status = defaultdict(set)
+        ranked = []
+        
+        for player_id, player in self.players.items():
+            if player.position:
+                by_position[player.position.lower()].add(player_id)
+            if player.previous_school:
+                by_school[player.previous_school.lower()].add(player_id)
+            if player.destination_school:
+                by_school[player.destination_school.lower()].add(player_id)
+            if player.status:
+                by_status[player.status.lower()].add(player_id)
+            if player.composite_ranking:
+                ranked.append((player.composite_ranking, player_id))
+        
+        ranked.sort()
+        self._by_position = dict(by_position)
+        self._by_school = dict(by_school)
+        self._by_status = dict(by_status)
+        self._ranked = ranked
+    
+    @staticmethod
+    def _index_lookup(index: Dict[str, set], query_lc: str) -> set:
+        """Collect player ids whose indexed value contains query_lc"""
+        # Scan the few distinct keys rather than the players themselves.
+        # No exact-key shortcut: substring semantics mean a query equal to
+        # one key must still match the longer keys containing it
+        matched = set()
+        for key, ids in index.items():
+            if query_lc in key:
+                matched |= ids
+        return matched
     
     def _generate_player_id(self, name: str, school: Optional[str]) -> str:
         """Generate a consistent ID for a player"""
-        # Normalize name (lowercase, remove spaces)
-        normalized_name = name.lower().replace(" ", "")
+        normalized_name = _canonical_id_token(name)
         
         # Add school if available
         if school:
-            normalized_school = school.lower().replace(" ", "")
-            return f"{normalized_name}_{normalized_school}"
+            return f"{normalized_name}_{_canonical_id_token(school)}"
         
         return normalized_name
     
-    def _update_player_from_source(self, player: TransferPlayer, source_player: Dict[str, Any], source: DataSource):
+    def _update_player_from_source(self, player: TransferPlayer, source_player: Dict[str, Any], source: DataSource, now_iso: str):
         """Update a consolidated player record with data from a specific source"""
         # Update last updated timestamp
-        player.last_updated[source] = datetime.now().isoformat()
+        player.last_updated[source] = now_iso
         
         # Update profile URL
         if "profile_url" in source_player and source_player["profile_url"]:
@@ -363,11 +549,19 @@ class TransferPortalOrchestrator:
             try:
                 # Parse the rank to an integer
                 rank = int(source_player["rank"])
+                old_rank = player.rankings.get(source)
                 player.rankings[source] = rank
                 
-                # Calculate composite ranking (average of available rankings)
-                if player.rankings:
-                    player.composite_ranking = int(sum(player.rankings.values()) / len(player.rankings))
+                # Maintain the running aggregates; subtracting a replaced
+                # value keeps re-ingesting the same source idempotent
+                if old_rank is None:
+                    player._rank_sum += rank
+                    player._rank_count += 1
+                else:
+                    player._rank_sum += rank - old_rank
+                
+                # Composite ranking (average of available rankings)
+                player.composite_ranking = int(player._rank_sum / player._rank_count)
             except (ValueError, TypeError):
                 pass
         
@@ -394,15 +588,15 @@ class TransferPortalOrchestrator:
         
         # Update basic fields (only if not already set or if this is ON3)
         # We prioritize ON3 data for basic fields as it's generally more complete
-        update_basic = (source == DataSource.ON3) or not any([
-            player.position,
-            player.height,
-            player.previous_school,
-            player.class_year,
-            player.eligibility,
-            player.status,
-            player.destination_school
-        ])
+        update_basic = (source == DataSource.ON3) or not (
+            player.position
+            or player.height
+            or player.previous_school
+            or player.class_year
+            or player.eligibility
+            or player.status
+            or player.destination_school
+        )
         
         if update_basic:
             if "position" in source_player and source_player["position"]:
@@ -436,25 +630,40 @@ class TransferPortalOrchestrator:
         if not self.players:
             return []
         
-        # Make a list from the dictionary values
-        players = list(self.players.values())
+        # Intersect candidate id sets from the secondary indexes; only the
+        # surviving candidates are ever materialized or scanned
+        candidates: Optional[set] = None
         
-        # Filter by source if specified
-        if query.source != DataSource.ALL:
-            players = [p for p in players if query.source in p.sources]
-        
-        # Apply basic filters
         if query.position:
-            players = [p for p in players if p.position and query.position.lower() in p.position.lower()]
+            candidates = self._index_lookup(self._by_position, query.position.lower())
         
         if query.school:
-            players = [p for p in players if (
-                (p.previous_school and query.school.lower() in p.previous_school.lower()) or
-                (p.destination_school and query.school.lower() in p.destination_school.lower())
-            )]
+            school_ids = self._index_lookup(self._by_school, query.school.lower())
+            candidates = school_ids if candidates is None else candidates & school_ids
         
         if query.status:
-            players = [p for p in players if p.status and query.status.lower() in p.status.lower()]
+            status_ids = self._index_lookup(self._by_status, query.status.lower())
+            candidates = status_ids if candidates is None else candidates & status_ids
+        
+        # Ranking range via bisect on the sorted (ranking, id) list
+        if query.min_ranking is not None or query.max_ranking is not None:
+            lo = 0
+            hi = len(self._ranked)
+            if query.min_ranking is not None:
+                lo = bisect_left(self._ranked, (query.min_ranking, ""))
+            if query.max_ranking is not None:
+                hi = bisect_left(self._ranked, (query.max_ranking + 1, ""))
+            ranked_ids = {player_id for _, player_id in self._ranked[lo:hi]}
+            candidates = ranked_ids if candidates is None else candidates & ranked_ids
+        
+        if candidates is None:
+            players = list(self.players.values())
+        else:
+            players = [self.players[pid] for pid in candidates if pid in self.players]
+        
+        # Filter by source if specified (no index; sources are short lists)
+        if query.source != DataSource.ALL:
+            players = [p for p in players if query.source in p.sources]
         
         # Apply stats filter (check all sources)
         if query.min_ppg is not None:
@@ -466,30 +675,17 @@ class TransferPortalOrchestrator:
                 )
             ]
         
-        # Apply ranking filters
-        if query.min_ranking is not None:
-            players = [
-                p for p in players
-                if p.composite_ranking and p.composite_ranking >= query.min_ranking
-            ]
-        
-        if query.max_ranking is not None:
-            players = [
-                p for p in players
-                if p.composite_ranking and p.composite_ranking <= query.max_ranking
-            ]
-        
-        # Sort by composite ranking if available, otherwise by name
-        players.sort(
-            key=lambda p: (
-                -(p.composite_ranking or float('inf')),
-                p.name
-            )
+        # Sort by composite ranking if available, otherwise by name.
+        # With a limit, heapq.nsmallest selects the top rows in
+        # O(K log limit) instead of fully sorting all K candidates.
+        sort_key = lambda p: (
+            -(p.composite_ranking or float('inf')),
+            p.name
         )
-        
-        # Apply limit
         if query.limit:
-            players = players[:query.limit]
+            players = heapq.nsmallest(query.limit, players, key=sort_key)
+        else:
+            players.sort(key=sort_key)
         
         return players
 
@@ -511,15 +707,22 @@ async def shutdown_event():
 
 
 @app.get("/portal/players")
-async def get_players():
+async def get_players(request: Request, response: Response):
     """Get all consolidated transfer portal players"""
     if not orchestrator.players:
         raise HTTPException(status_code=404, detail="No player data available")
     
+    # The payload only changes when a consolidation lands, so polling
+    # clients can revalidate with a 0-byte 304 instead of re-downloading
+    etag = f'W/"{int(orchestrator.last_consolidation or 0)}-{len(orchestrator.players)}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    
     return {
         "last_updated": orchestrator.last_consolidation,
         "player_count": len(orchestrator.players),
-        "players": [p.dict() for p in orchestrator.players.values()]
+        "players": orchestrator._players_serialized
     }
 
 
@@ -543,8 +746,16 @@ async def refresh_data(source: Optional[DataSource] = DataSource.ALL):
 
 
 @app.get("/portal/metrics")
-async def get_metrics():
+async def get_metrics(request: Request, response: Response):
     """Get metrics about the transfer portal data collection"""
+    # Weak validator over the counters that move when metrics change
+    refreshes = sum(m.refresh_count for m in orchestrator.metrics.values())
+    errors = sum(m.error_count for m in orchestrator.metrics.values())
+    etag = f'W/"{int(orchestrator.last_consolidation or 0)}-{refreshes}-{errors}-{len(orchestrator.players)}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    
     return {
         "agent_metrics": {
             source.value: metrics.dict() 
@@ -602,7 +813,10 @@ if __name__ == "__main__":
             "src.agents.transfer_portal_orchestrator:app", 
             host="0.0.0.0",  # Listen on all interfaces 
             port=9000, 
-            log_level="debug",
+            log_level="info",
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
             reload=False
         )
     except Exception as e: